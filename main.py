@@ -1,65 +1,315 @@
 """
 MCP Docker Developer Server (MCPDS)
 """
+import anyio
+import asyncio
 import docker
+import httpx
 import tempfile
+import weakref
 import os
+import shutil
 import argparse
+import atexit
+import importlib
+import importlib.util
 import server_version as sv
 
+import subprocess
 import sys
-import json
 import time
 import psutil
+import queue
 import logging
 
 import logging.handlers
 from pathlib import Path
 from typing import Dict, Any
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, partial, wraps
 from enum import Enum
-from cachetools import TTLCache
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+from subtools.container_pool import ContainerPool
+from subtools.fastcache import FastTTLCache
+from subtools.serialization import dumps
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a case-insensitive "true"/"false" environment flag"""
+    value = os.getenv(name)
+    return value.lower() == "true" if value else default
+
 
 # Environment variables
 _DEVDOCS_URL = os.getenv("DEVDOCS_URL", "http://devdocs:9292")
 _SEARXNG_URL = os.getenv("SEARXNG_URL", "http://searxng:8080")
-uptime_launched = datetime.now()
-
-# Import all our modular tools
-try:
-    from subtools.docker_tools import DockerTools
-    from subtools.browser_tools import BrowserTools
-    from subtools.monitoring_tools import MonitoringTools
-    from subtools.development_tools import DevelopmentTools
-    from subtools.data_storage import MarkdownTools
-    from subtools.workflow_tools import WorkflowTools
-    from subtools.documentation_tools import DocumentationTools
-    from subtools.firecrawl_tools import FirecrawlTools
-    from subtools.searxng_tools import SearXNGTools
-    from subtools.module_finder import ModuleFinder
-    from subtools.llms_support import LLMSText
-    from subtools.prompts import PromptManager
-
-
-    HAS_ALL_SUBTOOLS = True
-except ImportError as e:
-    print(f"Warning: Some subtools could not be imported: {e}")
-    HAS_ALL_SUBTOOLS = False
-
+_ENABLE_FIRECRAWL = _env_bool("ENABLE_FIRECRAWL")
+_ENABLE_LOCAL_FIRECRAWL = _env_bool("ENABLE_LOCAL_FIRECRAWL")
+_LOCAL_URL = os.getenv("LOCAL_URL")
+_FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
+_SKIP_GPU_PROBE = os.getenv("MCP_SKIP_GPU_PROBE", "").lower() in ("1", "true")
+
+# Whether the server was started from an interactive terminal
+_IS_TTY = sys.stdin.isatty()
+
+# Shared server logger; propagation is disabled so records are only
+# handled by the handlers attached in setup_enhanced_logging
+_LOGGER = logging.getLogger("MCPDockerServer")
+_LOGGER.propagate = False
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
 
 # Configuration
 CACHE_TTL = 300  # 5 minutes
 MAX_CACHE_SIZE = 1000
 RATE_LIMIT_REQUESTS = 100
 RATE_LIMIT_WINDOW = 60  # seconds
-MAX_WORKERS = 10
+MAX_WORKERS = int(os.getenv("MCP_MAX_WORKERS", "32"))  # Docker/HTTP calls are I/O-bound
 REQUEST_TIMEOUT = 30
 CONTAINER_TIMEOUT = 300
 
+# Server data directories, fixed relative to this file
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_DOCS_DIR = _SCRIPT_DIR / "documentation"
+_LOGS_DIR = _SCRIPT_DIR / "logs"
+_CONFIG_DIR = _SCRIPT_DIR / "config"
+_BACKUP_DIR = _SCRIPT_DIR / "backups"
+
+
+# Comprehensive set of allowed development images
+_BASE_ALLOWED_IMAGES = frozenset(
+    {
+        # Base OS images
+        "ubuntu:latest",
+        "ubuntu:22.04",
+        "ubuntu:20.04",
+        "debian:latest",
+        "debian:bullseye",
+        "debian:bookworm",
+        "alpine:latest",
+        "alpine:3.18",
+        "fedora:latest",
+        "fedora:38",
+        "rockylinux:latest",
+        "rockylinux:9",
+        # Language-specific images
+        "python:3.11",
+        "python:3.10",
+        "python:3.9",
+        "python:latest",
+        "node:18",
+        "node:20",
+        "node:latest",
+        "node:18-alpine",
+        "node:20-alpine",
+        "openjdk:17",
+        "openjdk:11",
+        "openjdk:21",
+        "golang:1.21",
+        "golang:latest",
+        "golang:1.21-alpine",
+        "rust:latest",
+        "rust:1.70",
+        "rust:1.70-slim",
+        "php:8.2",
+        "php:8.1",
+        "php:latest",
+        "ruby:3.2",
+        "ruby:latest",
+        # Database images
+        "postgres:15",
+        "postgres:14",
+        "postgres:latest",
+        "mysql:8.0",
+        "mysql:latest",
+        "redis:7",
+        "redis:latest",
+        "redis:alpine",
+        "mongodb:latest",
+        "mongodb:7",
+        # Web servers
+        "nginx:latest",
+        "nginx:alpine",
+        "httpd:latest",
+        "httpd:alpine",
+    }
+)
+
+# Images only allowed when GPU support is detected
+_GPU_ALLOWED_IMAGES = frozenset(
+    {
+        "nvidia/cuda:12.0-runtime-ubuntu22.04",
+        "nvidia/cuda:11.8-runtime-ubuntu22.04",
+        "pytorch/pytorch:latest",
+        "tensorflow/tensorflow:latest-gpu",
+        "rocm/rocm-terminal:latest",
+        "rocm/dev-ubuntu-20.04:latest",
+        "rocm/dev-ubuntu-22.04:latest",
+    }
+)
+
+_ALLOWED_IMAGES_WITH_GPU = _BASE_ALLOWED_IMAGES | _GPU_ALLOWED_IMAGES
+
+# Tool modules registered with the MCP server, in order:
+# (attribute, config key, registration methods, log message)
+_TOOL_REGISTRATIONS = (
+    ("llms_support", None, ("add_tools",), None),
+    (
+        "docker_tools",
+        "docker_management",
+        ("register_tools",),
+        "Registered Docker management tools",
+    ),
+    (
+        "module_finder",
+        "module_finder",
+        ("add_tools",),
+        "Registered Module Finder tools",
+    ),
+    (
+        "browser_tools",
+        "browser_automation",
+        ("register_tools",),
+        "Registered browser automation tools",
+    ),
+    ("PromptManager", None, ("add_prompt",), "Registered Prompt Manager"),
+    (
+        "monitoring_tools",
+        "monitoring_tools",
+        ("register_tools",),
+        "Registered monitoring tools",
+    ),
+    (
+        "development_tools",
+        "development_tools",
+        ("register_tools",),
+        "Registered development tools",
+    ),
+    (
+        "workflow_tools",
+        "workflow_tools",
+        ("register_tools",),
+        "Registered workflow automation tools",
+    ),
+    ("data_storage_tools", None, ("add_mcp_tools",), "Registered data storage tools"),
+    (
+        "documentation_tools",
+        "documentation_tools",
+        ("register_tools", "register_resources"),
+        "Registered documentation tools",
+    ),
+    (
+        "firecrawl_tools",
+        "firecrawl_tools",
+        ("register_tools",),
+        "Registered Firecrawl tools",
+    ),
+    ("searxng_tools", "searxng_tools", ("register_tools",), "Registered SearXNG tools"),
+)
+
+
+def _ensure_dir(path: Path):
+    """Create a directory unless a cheap stat shows it already exists"""
+    try:
+        path.stat()
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+# Thread pool for blocking Docker/HTTP operations, shared by every server
+# in the process and shut down when the last one is cleaned up
+_shared_executor = None
+_live_servers = weakref.WeakSet()
+
+
+def _acquire_executor(server) -> ThreadPoolExecutor:
+    """Return the shared thread pool, creating it on first use"""
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS,
+            thread_name_prefix="MCPDocker",
+        )
+    _live_servers.add(server)
+    return _shared_executor
+
+
+def _release_executor(server):
+    """Shut the shared thread pool down once no live server is using it"""
+    global _shared_executor
+    _live_servers.discard(server)
+    if not _live_servers and _shared_executor is not None:
+        _shared_executor.shutdown(wait=True)
+        _shared_executor = None
+
+
+@atexit.register
+def _shutdown_shared_executor():
+    if _shared_executor is not None:
+        _shared_executor.shutdown(wait=False)
+
+
+def _probe_gpu_tool(command: str) -> bool:
+    """Return True if a GPU management CLI is installed and runs successfully"""
+    try:
+        result = subprocess.run([command], capture_output=True, text=True, timeout=5)
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+def _ttl_cached(seconds: float):
+    """Cache a no-argument function's result for a short time window"""
+
+    def decorator(func):
+        slot = [None, 0.0]  # [value, expires_at]
+
+        @wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            if now >= slot[1]:
+                slot[0] = func()
+                slot[1] = now + seconds
+            return slot[0]
+
+        return wrapper
+
+    return decorator
+
+
+def _disk_percent(path: str) -> float:
+    """Disk usage percentage as reported by df (excludes root-reserved blocks)"""
+    usage = shutil.disk_usage(path)
+    available = usage.used + usage.free
+    return round(usage.used / available * 100, 1) if available else 0.0
+
+
+# psutil keeps the cpu_percent() baseline per thread, so system samples are
+# always taken on this one thread rather than on the shared executor
+_SYSTEM_SAMPLER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="system-sampler")
+
+
+@_ttl_cached(1.0)
+def _sample_system_resources() -> Dict[str, float]:
+    """CPU, memory and root disk utilisation percentages"""
+    return {
+        "cpu_percent": psutil.cpu_percent(),
+        "memory_percent": psutil.virtual_memory().percent,
+        "disk_percent": _disk_percent("/"),
+    }
+
+
+def _stop_and_remove(container):
+    """Stop and remove a container, ignoring errors during shutdown"""
+    try:
+        container.stop(timeout=2)
+        container.remove()
+    except Exception:
+        pass
+
 
 class SecurityLevel(str, Enum):
     LOW = "low"
@@ -88,14 +338,15 @@ class ServiceConfig:
     firecrawl_tools: bool = True
     searxng_tools: bool = True
     websocket_enabled: bool = False
-    module_Finder: bool = True
+    module_finder: bool = True
     security_level: SecurityLevel = SecurityLevel.MEDIUM
     auto_cleanup_enabled: bool = True
     health_checks_enabled: bool = True
     distributed_mode: bool = False
 
 
-class ServerMetrics(BaseModel):
+@dataclass(slots=True)
+class ServerMetrics:
     """Server performance metrics"""
 
     requests_total: int = 0
@@ -107,7 +358,8 @@ class ServerMetrics(BaseModel):
     uptime_seconds: float = 0.0
 
 
-class HealthStatus(BaseModel):
+@dataclass(slots=True)
+class HealthStatus:
     """System health status"""
 
     status: str = "healthy"
@@ -115,7 +367,7 @@ class HealthStatus(BaseModel):
     memory_usage_percent: float = 0.0
     cpu_usage_percent: float = 0.0
     disk_usage_percent: float = 0.0
-    last_check: datetime = Field(default_factory=datetime.now)
+    last_check: float = field(default_factory=time.time)
 
 
 class MCPDockerServer:
@@ -129,20 +381,19 @@ class MCPDockerServer:
         )
 
         # Initialize directory structure
-        script_dir = Path(__file__).parent
-        self.docs_dir = script_dir / "documentation"
-        self.logs_dir = script_dir / "logs"
-        self.config_dir = script_dir / "config"
-        self.backup_dir = script_dir / "backups"
-
-        # Create directories
-        for directory in [
+        self.docs_dir = _DOCS_DIR
+        self.logs_dir = _LOGS_DIR
+        self.config_dir = _CONFIG_DIR
+        self.backup_dir = _BACKUP_DIR
+
+        # Create directories, skipping the mkdir when they already exist
+        for directory in (
             self.docs_dir,
             self.logs_dir,
             self.config_dir,
             self.backup_dir,
-        ]:
-            directory.mkdir(exist_ok=True)
+        ):
+            _ensure_dir(directory)
 
         # Initialize logging
         self.setup_enhanced_logging()
@@ -153,99 +404,38 @@ class MCPDockerServer:
 
         # Core storage
         self.active_containers = {}
+        self.container_pool = ContainerPool(
+            self.docker_client, idle_timeout=CONTAINER_TIMEOUT, logger=self.logger
+        )
         self.temp_dir = tempfile.mkdtemp(prefix="mcpdocker_enhanced_")
 
         # Performance and monitoring
         self.metrics = ServerMetrics()
         self.health_status = HealthStatus()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+        # cpu_percent() compares against the previous call on the same thread,
+        # so take a baseline on the thread health_check samples from
+        _SYSTEM_SAMPLER.submit(psutil.cpu_percent, None)
+
+        # Thread pool for blocking Docker/HTTP operations
+        self.executor = _acquire_executor(self)
+
+        # Shared HTTP client for probing external services
+        self._http = httpx.AsyncClient(
+            timeout=5.0, limits=httpx.Limits(max_keepalive_connections=8)
+        )
 
         # System capabilities
         self.gpu_info = self._detect_gpu_support()
         self.gpu_available = self.gpu_info["has_gpu"]
 
-        # Thread pool for async operations
-        self.executor = ThreadPoolExecutor(
-            max_workers=min(MAX_WORKERS, (os.cpu_count() or 1) + 4),
-            thread_name_prefix="MCPDocker",
-        )
-        self.llms_support = LLMSText(
-
+        # Allowed development images, extended with GPU images when available
+        self.allowed_images = (
+            _ALLOWED_IMAGES_WITH_GPU if self.gpu_available else _BASE_ALLOWED_IMAGES
         )
-        # Define comprehensive set of allowed development images
-        self.allowed_images = {
-            # Base OS images
-            "ubuntu:latest",
-            "ubuntu:22.04",
-            "ubuntu:20.04",
-            "debian:latest",
-            "debian:bullseye",
-            "debian:bookworm",
-            "alpine:latest",
-            "alpine:3.18",
-            "fedora:latest",
-            "fedora:38",
-            "rockylinux:latest",
-            "rockylinux:9",
-            # Language-specific images
-            "python:3.11",
-            "python:3.10",
-            "python:3.9",
-            "python:latest",
-            "node:18",
-            "node:20",
-            "node:latest",
-            "node:18-alpine",
-            "node:20-alpine",
-            "openjdk:17",
-            "openjdk:11",
-            "openjdk:21",
-            "golang:1.21",
-            "golang:latest",
-            "golang:1.21-alpine",
-            "rust:latest",
-            "rust:1.70",
-            "rust:1.70-slim",
-            "php:8.2",
-            "php:8.1",
-            "php:latest",
-            "ruby:3.2",
-            "ruby:latest",
-            # Database images
-            "postgres:15",
-            "postgres:14",
-            "postgres:latest",
-            "mysql:8.0",
-            "mysql:latest",
-            "redis:7",
-            "redis:latest",
-            "redis:alpine",
-            "mongodb:latest",
-            "mongodb:7",
-            # Web servers
-            "nginx:latest",
-            "nginx:alpine",
-            "httpd:latest",
-            "httpd:alpine",
-        }
 
-        # Add GPU images if available
-        if self.gpu_available:
-            gpu_images = {
-                "nvidia/cuda:12.0-runtime-ubuntu22.04",
-                "nvidia/cuda:11.8-runtime-ubuntu22.04",
-                "pytorch/pytorch:latest",
-                "tensorflow/tensorflow:latest-gpu",
-                "rocm/rocm-terminal:latest",
-                "rocm/dev-ubuntu-20.04:latest",
-                "rocm/dev-ubuntu-22.04:latest",
-            }
-            self.allowed_images.update(gpu_images)
-
-        # Initialize all tool modules
-        self._init_tool_modules()
-
-        # Register all tools
+        # Register all tools, building each enabled tool module on first use
         self._register_all_tools()
 
     def _init_docker_client(self):
@@ -253,6 +443,10 @@ class MCPDockerServer:
         try:
             self.docker_client = docker.from_env()
             self.docker_client.ping()
+            # The engine version can't change under a live connection
+            self.docker_version = self.docker_client.version().get(
+                "Version", "Unknown"
+            )
             self.logger.info("Docker client initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize Docker client: {e}")
@@ -260,185 +454,209 @@ class MCPDockerServer:
 
     def _init_caching_system(self):
         """Initialize caching system"""
-        self.cache = TTLCache(maxsize=MAX_CACHE_SIZE, ttl=CACHE_TTL)
+        self.cache = FastTTLCache(maxsize=MAX_CACHE_SIZE, ttl=CACHE_TTL)
 
-    def _init_tool_modules(self):
-        """Initialize all tool modules"""
-        if not HAS_ALL_SUBTOOLS:
+    def _load_subtool(self, module_name: str, class_name: str):
+        """Import a subtool class on demand, returning None if unavailable"""
+        try:
+            module = importlib.import_module(f"subtools.{module_name}")
+        except ImportError as e:
             self.logger.warning(
-                "Not all subtools available - some functionality will be limited"
-            )
-
-        # Initialize Docker tools
-        self.docker_tools = (
-            DockerTools(
-                docker_client=self.docker_client,
-                allowed_images=self.allowed_images,
-                temp_dir=self.temp_dir,
-                logger=self.logger,
+                f"Subtool '{module_name}' could not be imported - "
+                f"some functionality will be limited: {e}"
             )
-            if HAS_ALL_SUBTOOLS
-            else None
+            return None
+        return getattr(module, class_name)
+
+    def _create_subtool(
+        self, config_key: str, module_name: str, class_name: str, **kwargs
+    ):
+        """Instantiate a subtool, importing it only if its feature is enabled"""
+        if config_key and not self._get_config(config_key, True):
+            return None
+        tool_class = self._load_subtool(module_name, class_name)
+        return tool_class(**kwargs) if tool_class else None
+
+    # Tool modules are built on first access, so disabled features are never
+    # imported or constructed
+
+    @cached_property
+    def llms_support(self):
+        return self._create_subtool(None, "llms_support", "LLMSText")
+
+    @cached_property
+    def docker_tools(self):
+        return self._create_subtool(
+            "docker_management",
+            "docker_tools",
+            "DockerTools",
+            docker_client=self.docker_client,
+            allowed_images=self.allowed_images,
+            temp_dir=self.temp_dir,
+            logger=self.logger,
+            container_pool=self.container_pool,
+            active_containers=self.active_containers,
         )
-        self.module_finder = ModuleFinder() if HAS_ALL_SUBTOOLS else None
-        self.PromptManager = PromptManager()
-        # Initialize browser tools
-        self.browser_tools = (
-            BrowserTools(temp_dir=self.temp_dir, logger=self.logger)
-            if HAS_ALL_SUBTOOLS
-            else None
+
+    @cached_property
+    def module_finder(self):
+        return self._create_subtool("module_finder", "module_finder", "ModuleFinder")
+
+    @cached_property
+    def PromptManager(self):
+        return self._create_subtool(None, "prompts", "PromptManager")
+
+    @cached_property
+    def browser_tools(self):
+        return self._create_subtool(
+            "browser_automation",
+            "browser_tools",
+            "BrowserTools",
+            temp_dir=self.temp_dir,
+            logger=self.logger,
         )
 
-        # Initialize monitoring tools
-        self.monitoring_tools = (
-            MonitoringTools(
-                docker_client=self.docker_client,
-                active_containers=self.active_containers,
-                logger=self.logger,
-            )
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def monitoring_tools(self):
+        return self._create_subtool(
+            "monitoring_tools",
+            "monitoring_tools",
+            "MonitoringTools",
+            docker_client=self.docker_client,
+            active_containers=self.active_containers,
+            logger=self.logger,
         )
 
-        # Initialize development tools
-        self.development_tools = (
-            DevelopmentTools(
-                docker_client=self.docker_client,
-                active_containers=self.active_containers,
-                temp_dir=self.temp_dir,
-                logger=self.logger,
-            )
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def development_tools(self):
+        return self._create_subtool(
+            "development_tools",
+            "development_tools",
+            "DevelopmentTools",
+            docker_client=self.docker_client,
+            active_containers=self.active_containers,
+            temp_dir=self.temp_dir,
+            logger=self.logger,
+            container_pool=self.container_pool,
         )
 
-        # Initialize workflow tools
-        self.workflow_tools = (
-            WorkflowTools(temp_dir=self.temp_dir, logger=self.logger)
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def workflow_tools(self):
+        return self._create_subtool(
+            "workflow_tools",
+            "workflow_tools",
+            "WorkflowTools",
+            temp_dir=self.temp_dir,
+            logger=self.logger,
         )
 
-        # Initialize data storage tools
-        self.data_storage_tools = (
-            MarkdownTools(
-                markdown_path="/markdown"
-            )
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def data_storage_tools(self):
+        return self._create_subtool(
+            None, "data_storage", "MarkdownTools", markdown_path="/markdown"
         )
 
-        # Initialize documentation tools
-        self.documentation_tools = (
-            DocumentationTools(
-                docs_dir=self.docs_dir, devdocs_url=_DEVDOCS_URL, logger=self.logger
-            )
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def documentation_tools(self):
+        return self._create_subtool(
+            "documentation_tools",
+            "documentation_tools",
+            "DocumentationTools",
+            docs_dir=self.docs_dir,
+            devdocs_url=_DEVDOCS_URL,
+            logger=self.logger,
         )
 
-        # Initialize web scraping and search tools
-        if os.getenv("ENABLE_FIRECRAWL", "false") == "true":
-            # self.firecrawl_tools = FirecrawlTools(logger=self.logger) if HAS_ALL_SUBTOOLS else None
-            if os.getenv("ENABLE_LOCAL_FIRECRAWL") == "true" and os.getenv("LOCAL_URL"):
-                self.firecrawl_tools = (
-                    FirecrawlTools(
-                        logger=self.logger,
-                        local_url=os.getenv("LOCAL_URL"),
-                        api_key=None,
-                    )
-                    if HAS_ALL_SUBTOOLS
-                    else None
-                )
-            else:
-                self.firecrawl_tools = (
-                    FirecrawlTools(
-                        logger=self.logger,
-                        local_url="http://localhost:3002",
-                        api_key=os.getenv("FIRECRAWL_API_KEY"),
-                    )
-                    if HAS_ALL_SUBTOOLS
-                    else None
-                )
-        else:
-            self.firecrawl_tools = None
+    @cached_property
+    def firecrawl_tools(self):
+        if not _ENABLE_FIRECRAWL:
+            return None
+        use_local_firecrawl = _ENABLE_LOCAL_FIRECRAWL and _LOCAL_URL
+        firecrawl_url = _LOCAL_URL if use_local_firecrawl else "http://localhost:3002"
+        return self._create_subtool(
+            "firecrawl_tools",
+            "firecrawl_tools",
+            "FirecrawlTools",
+            logger=self.logger,
+            local_url=firecrawl_url,
+            api_key=None if use_local_firecrawl else _FIRECRAWL_API_KEY,
+        )
 
-        self.searxng_tools = (
-            SearXNGTools(searxng_url=_SEARXNG_URL, logger=self.logger)
-            if HAS_ALL_SUBTOOLS
-            else None
+    @cached_property
+    def searxng_tools(self):
+        return self._create_subtool(
+            "searxng_tools",
+            "searxng_tools",
+            "SearXNGTools",
+            searxng_url=_SEARXNG_URL,
+            logger=self.logger,
         )
 
     def _register_all_tools(self):
         """Register all tools with the MCP server"""
         try:
-            if not HAS_ALL_SUBTOOLS:
-                self.logger.error("Cannot register tools - subtools not available")
-                return
-            if self.llms_support:
-                self.llms_support.add_tools(self.mcp)
-            # Register core Docker tools
-            if self.docker_tools and self._get_config("docker_management", True):
-                self.docker_tools.register_tools(self.mcp)
-                self.logger.info("Registered Docker management tools")
-            if self.module_finder and self._get_config("module_finder", True):
-                self.module_finder.add_tools(self.mcp)
-                self.logger.info("Registered Module Finder tools")
-            # Register browser automation tools
-            if self.browser_tools and self._get_config("browser_automation", True):
-                self.browser_tools.register_tools(self.mcp)
-                self.logger.info("Registered browser automation tools")
-            if self.PromptManager:
-                self.PromptManager.add_prompt(self.mcp)
-                self.logger.info("Registered Prompt Manager")
-            # Register monitoring tools
-            if self.monitoring_tools and self._get_config("monitoring_tools", True):
-                self.monitoring_tools.register_tools(self.mcp)
-                self.logger.info("Registered monitoring tools")
-
-            # Register development tools
-            if self.development_tools and self._get_config("development_tools", True):
-                self.development_tools.register_tools(self.mcp)
-                self.logger.info("Registered development tools")
-
-            # Register workflow tools
-            if self.workflow_tools and self._get_config("workflow_tools", True):
-                self.workflow_tools.register_tools(self.mcp)
-                self.logger.info("Registered workflow automation tools")
-
-            # Register data storage tools
-            if self.data_storage_tools:
-                self.data_storage_tools.add_mcp_tools(self.mcp)
-                self.logger.info("Registered data storage tools")
-
-            # Register documentation tools
-            if self.documentation_tools and self._get_config(
-                "documentation_tools", True
-            ):
-                self.documentation_tools.register_tools(self.mcp)
-                self.documentation_tools.register_resources(self.mcp)
-                self.logger.info("Registered documentation tools")
-
-            # Register web scraping and search tools
-            if self.firecrawl_tools and self._get_config("firecrawl_tools", True):
-                self.firecrawl_tools.register_tools(self.mcp)
-                self.logger.info("Registered Firecrawl tools")
-
-            if self.searxng_tools and self._get_config("searxng_tools", True):
-                self.searxng_tools.register_tools(self.mcp)
-                self.logger.info("Registered SearXNG tools")
-
-            # Register notification tools
+            for attr, config_key, methods, message in _TOOL_REGISTRATIONS:
+                if config_key and not self._get_config(config_key, True):
+                    continue
+                tool = getattr(self, attr)
+                if not tool:
+                    continue
+                for method in methods:
+                    getattr(tool, method)(self.mcp)
+                if message:
+                    self.logger.info(message)
 
             # Register basic utility tools
             self._register_utility_tools()
-            
+
             # Web interface has been removed to focus on core MCP functionality
 
         except Exception as e:
             self.logger.error(f"Failed to register tools: {e}")
             raise
 
+    def _build_static_server_info(self) -> Dict[str, Any]:
+        """Server info fields that do not change while the process runs"""
+        return {
+            "server_name": "MCPDocker-Enhanced-Modular",
+            "version": f"{sv.SERVER_VERSION} - {sv.SERVER_NICKNAME}",
+            "uptime_seconds": None,
+            "capabilities": {
+                "docker_management": bool(self.docker_tools),
+                "browser_automation": bool(self.browser_tools),
+                "monitoring": bool(self.monitoring_tools),
+                "development_tools": bool(self.development_tools),
+                "workflow_automation": bool(self.workflow_tools),
+                "documentation": bool(self.documentation_tools),
+                "web_scraping": bool(self.firecrawl_tools),
+                "web_search": bool(self.searxng_tools),
+                "gpu_support": self.gpu_available,
+            },
+            "configuration": {
+                "allowed_images_count": len(self.allowed_images),
+                "temp_directory": self.temp_dir,
+                "docs_directory": str(self.docs_dir),
+                "devdocs_url": _DEVDOCS_URL,
+                "searxng_url": _SEARXNG_URL,
+            },
+            "system": {
+                "cpu_count": os.cpu_count(),
+                "memory_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+                "platform": sys.platform,
+            },
+            "docker": {
+                "connected": True,
+                "version": self.docker_version,
+                "active_containers": None,
+                "container_pool": None,
+            },
+        }
+
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call on the server's executor instead of the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
     def _register_utility_tools(self):
         """Register basic utility tools"""
 
@@ -446,44 +664,21 @@ class MCPDockerServer:
         async def get_server_info() -> str:
             """Get comprehensive server information and capabilities"""
             try:
-                info = {
-                    "server_name": "MCPDocker-Enhanced-Modular",
-                    "version": f"{sv.SERVER_VERSION} - {sv.SERVER_NICKNAME}",
-                    "uptime_seconds": time.time() - self.start_time,
-                    "capabilities": {
-                        "docker_management": bool(self.docker_tools),
-                        "browser_automation": bool(self.browser_tools),
-                        "monitoring": bool(self.monitoring_tools),
-                        "development_tools": bool(self.development_tools),
-                        "workflow_automation": bool(self.workflow_tools),
-                        "documentation": bool(self.documentation_tools),
-                        "web_scraping": bool(self.firecrawl_tools),
-                        "web_search": bool(self.searxng_tools),
-                        "gpu_support": self.gpu_available,
-                    },
-                    "configuration": {
-                        "allowed_images_count": len(self.allowed_images),
-                        "temp_directory": self.temp_dir,
-                        "docs_directory": str(self.docs_dir),
-                        "devdocs_url": _DEVDOCS_URL,
-                        "searxng_url": _SEARXNG_URL,
-                    },
-                    "system": {
-                        "cpu_count": os.cpu_count(),
-                        "memory_gb": round(
-                            psutil.virtual_memory().total / (1024**3), 2
-                        ),
-                        "platform": sys.platform,
-                    },
-                    "docker": {
-                        "connected": True,
-                        "version": self.docker_client.version().get(
-                            "Version", "Unknown"
-                        ),
-                        "active_containers": len(self.active_containers),
-                    },
-                }
-                return json.dumps(info, indent=2)
+                # Everything but uptime and container counts is fixed for the
+                # process lifetime, so keep it in the TTL cache
+                static_info = self.cache.get("server_info_static")
+                if static_info is None:
+                    static_info = await self._run_blocking(
+                        self._build_static_server_info
+                    )
+                    self.cache["server_info_static"] = static_info
+
+                info = dict(static_info)
+                info["uptime_seconds"] = time.monotonic() - self.start_time
+                info["docker"] = dict(static_info["docker"])
+                info["docker"]["active_containers"] = len(self.active_containers)
+                info["docker"]["container_pool"] = self.container_pool.get_stats()
+                return dumps(info)
             except Exception as e:
                 return f"Error getting server info: {str(e)}"
 
@@ -508,49 +703,37 @@ class MCPDockerServer:
                             "details": "All directories accessible",
                         },
                     },
-                    "system_resources": {
-                        "cpu_percent": psutil.cpu_percent(),
-                        "memory_percent": psutil.virtual_memory().percent,
-                        "disk_percent": psutil.disk_usage("/").percent,
-                    },
+                    "system_resources": await asyncio.get_running_loop().run_in_executor(
+                        _SYSTEM_SAMPLER, _sample_system_resources
+                    ),
                 }
 
-                # Check external services
+                # Check external services concurrently
+                probes = {}
                 if self.documentation_tools:
-                    try:
-                        import requests
+                    probes["devdocs"] = _DEVDOCS_URL
+                if self.searxng_tools:
+                    probes["searxng"] = _SEARXNG_URL
 
-                        response = requests.get(_DEVDOCS_URL, timeout=5)
-                        health["services"]["devdocs"] = {
-                            "status": (
-                                "healthy" if response.status_code == 200 else "degraded"
-                            ),
-                            "details": f"HTTP {response.status_code}",
-                        }
-                    except Exception:
-                        health["services"]["devdocs"] = {
+                responses = await asyncio.gather(
+                    *(self._http.get(url) for url in probes.values()),
+                    return_exceptions=True,
+                )
+                for service, response in zip(probes, responses):
+                    if isinstance(response, Exception):
+                        health["services"][service] = {
                             "status": "unavailable",
                             "details": "Service not reachable",
                         }
-
-                if self.searxng_tools:
-                    try:
-                        import requests
-
-                        response = requests.get(_SEARXNG_URL, timeout=5)
-                        health["services"]["searxng"] = {
+                    else:
+                        health["services"][service] = {
                             "status": (
                                 "healthy" if response.status_code == 200 else "degraded"
                             ),
                             "details": f"HTTP {response.status_code}",
                         }
-                    except Exception:
-                        health["services"]["searxng"] = {
-                            "status": "unavailable",
-                            "details": "Service not reachable",
-                        }
 
-                return json.dumps(health, indent=2)
+                return dumps(health)
             except Exception as e:
                 return f"Error performing health check: {str(e)}"
 
@@ -559,9 +742,11 @@ class MCPDockerServer:
         """Setup enhanced logging with rotation"""
         log_file = self.logs_dir / "mcpdocker.log"
 
-        # Create logger
-        self.logger = logging.getLogger("MCPDockerServer")
+        # Reuse the module logger; handlers are only attached once per process
+        self.logger = _LOGGER
         self.logger.setLevel(logging.INFO)
+        if self.logger.handlers:
+            return
 
         # Create handlers
         file_handler = logging.handlers.RotatingFileHandler(
@@ -569,47 +754,43 @@ class MCPDockerServer:
         )
         console_handler = logging.StreamHandler()
 
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        file_handler.setFormatter(_LOG_FORMATTER)
+        console_handler.setFormatter(_LOG_FORMATTER)
+
+        # Only add console handler if running interactively
+        handlers = [file_handler, console_handler] if _IS_TTY else [file_handler]
 
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        if sys.stdin.isatty():  # Only add console handler if running interactively
-            self.logger.addHandler(console_handler)
+        # Callers only enqueue records; a background listener thread does
+        # the actual file/console I/O and is flushed at interpreter exit
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
 
     def _detect_gpu_support(self) -> Dict[str, Any]:
         """Detect available GPU support"""
         gpu_info = {"has_gpu": False, "type": None, "details": {}}
 
-        try:
-            import subprocess
-
-            # Check NVIDIA
-            result = subprocess.run(
-                ["nvidia-smi"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                gpu_info["has_gpu"] = True
-                gpu_info["type"] = "nvidia"
-                gpu_info["details"]["nvidia"] = "Available"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # GPU images are never offered in strict mode, so don't spawn the probes
+        if (
+            _SKIP_GPU_PROBE
+            or self.service_config.security_level == SecurityLevel.STRICT
+        ):
+            return gpu_info
 
-        try:
-            # Check AMD ROCm
-            result = subprocess.run(
-                ["rocm-smi"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                gpu_info["has_gpu"] = True
-                gpu_info["type"] = "amd_rocm"
-                gpu_info["details"]["amd_rocm"] = "Available"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # Probe NVIDIA and AMD ROCm concurrently
+        has_nvidia, has_rocm = self.executor.map(
+            _probe_gpu_tool, ("nvidia-smi", "rocm-smi")
+        )
+        if has_nvidia:
+            gpu_info["has_gpu"] = True
+            gpu_info["type"] = "nvidia"
+            gpu_info["details"]["nvidia"] = "Available"
+        if has_rocm:
+            gpu_info["has_gpu"] = True
+            gpu_info["type"] = "amd_rocm"
+            gpu_info["details"]["amd_rocm"] = "Available"
 
         return gpu_info
 
@@ -622,21 +803,35 @@ class MCPDockerServer:
     def cleanup(self):
         """Clean up resources on shutdown"""
         try:
-            # Stop all active containers
-            for container_id, container_info in self.active_containers.items():
-                try:
-                    container_info["container"].stop()
-                except Exception:
-                    pass
-
-            # Clean up temp directory
-            import shutil
-
+            # Stop and remove the containers this server owns (dev environments
+            # and pooled ones) in parallel, alongside the temp directory removal.
+            # Containers a client created with create_container are left running
+            # so they survive a stdio reconnect
+            owned_ids = [
+                container_id
+                for container_id, container_info in list(self.active_containers.items())
+                if container_info.get("owned_by_server")
+            ]
+            containers = [
+                self.active_containers.pop(container_id)["container"]
+                for container_id in owned_ids
+            ]
+            containers.extend(self.container_pool.drain())
+            pending = [
+                self.executor.submit(_stop_and_remove, container)
+                for container in containers
+            ]
             if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+                pending.append(
+                    self.executor.submit(shutil.rmtree, self.temp_dir, True)
+                )
+            wait(pending)
 
-            # Shutdown thread pool
-            self.executor.shutdown(wait=True)
+            # Shutdown thread pool once no other server is using it
+            _release_executor(self)
+
+            # Close the shared HTTP client
+            asyncio.run(self._http.aclose())
 
         except Exception as e:
             if hasattr(self, "logger"):
@@ -648,12 +843,30 @@ class MCPDockerServer:
     def run(self, transport_method: str = "stdio"):
         """Run the MCP server"""
         # Suppress all logging in MCP mode to avoid protocol conflicts
-        if transport_method == "stdio" and not sys.stdin.isatty():
+        if transport_method == "stdio" and not _IS_TTY:
             logging.getLogger().setLevel(logging.CRITICAL)
             logging.getLogger("uvicorn").setLevel(logging.CRITICAL)
             logging.getLogger("fastapi").setLevel(logging.CRITICAL)
 
-        return self.mcp.run(transport=transport_method)
+        if transport_method == "stdio":
+            return self.mcp.run(transport=transport_method)
+
+        # Serve HTTP transports on httptools when it is installed
+        uvicorn_config = {}
+        if importlib.util.find_spec("httptools"):
+            uvicorn_config["http"] = "httptools"
+
+        # uvicorn only applies its own loop setting in Server.run(), and
+        # FastMCP awaits Server.serve() inside anyio.run(), so uvloop has to
+        # be selected when starting the anyio event loop instead
+        serve = partial(
+            self.mcp.run_async,
+            transport=transport_method,
+            uvicorn_config=uvicorn_config,
+        )
+        if importlib.util.find_spec("uvloop"):
+            return anyio.run(serve, backend_options={"use_uvloop": True})
+        return anyio.run(serve)
 
 
 def serve_server():
@@ -664,7 +877,7 @@ def serve_server():
     parser.add_argument(
         "--transport",
         default="stdio",
-        choices=["stdio", "ws", "sse","streamable-http"],
+        choices=["stdio", "sse", "streamable-http"],
         help="Transport method for MCP communication",
     )
     parser.add_argument(
@@ -723,6 +936,7 @@ def serve_server():
     if args.disable_searxng:
         service_config.searxng_tools = False
 
+    server = None
     try:
         # Initialize and run server
         server = MCPDockerServer(service_config)
@@ -738,13 +952,14 @@ def serve_server():
         return server.run(transport_method=args.transport)
 
     except KeyboardInterrupt:
-        server.logger.info("Server shutdown requested")
+        if server is not None:
+            server.logger.info("Server shutdown requested")
         return 0
     except Exception as e:
         print(f"Failed to start server: {e}")
         return 1
     finally:
-        if "server" in locals():
+        if server is not None:
             server.cleanup()
 if __name__ == "__main__":
     sys.exit(serve_server())
\ No newline at end of file
@@ -2,12 +2,14 @@
 Browser automation tools using Playwright and Selenium
 """
 
-import json
+import asyncio
 import secrets
 import base64
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from subtools.serialization import dumps
+
 # Optional imports
 try:
     from playwright.async_api import async_playwright
@@ -28,6 +30,65 @@ try:
 except ImportError:
     HAS_SELENIUM = False
 
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+WARM_PAGE_POOL_SIZE = 2  # pre-opened pages kept ready per shared browser
+
+# Screenshot formats by file extension, and the extension used for each format
+SCREENSHOT_FORMATS = {".png": "png", ".jpg": "jpeg", ".jpeg": "jpeg"}
+SCREENSHOT_EXTENSIONS = {"png": ".png", "jpeg": ".jpg"}
+# Bytes base64-encoded per event loop slice; a multiple of 3 so the encoded
+# slices concatenate without padding in between
+BASE64_CHUNK_SIZE = 3 << 18  # 768 KiB
+
+_BY_METHODS = {}  # upper-cased locator name -> By strategy
+
+
+def _resolve_by(by: str) -> str:
+    """Map a locator name like "css" or "xpath" to a Selenium By strategy"""
+    key = by.upper()
+    method = _BY_METHODS.get(key)
+    if method is None:
+        method = _BY_METHODS[key] = getattr(By, key, By.CSS_SELECTOR)
+    return method
+
+
+async def _b64encode_chunked(data: bytes) -> bytes:
+    """base64-encode in slices, yielding to the event loop between them
+
+    b64encode holds the GIL for its whole run, so handing a large image to
+    a worker thread would still stall the loop; slicing keeps each stall short.
+    """
+    view = memoryview(data)
+    parts = []
+    for start in range(0, len(view), BASE64_CHUNK_SIZE):
+        parts.append(base64.b64encode(view[start : start + BASE64_CHUNK_SIZE]))
+        await asyncio.sleep(0)
+    return b"".join(parts)
+
+
+async def _b64decode_chunked(data: str) -> bytes:
+    """base64-decode in slices, yielding to the event loop between them"""
+    step = BASE64_CHUNK_SIZE // 3 * 4  # encoded length of one input chunk
+    parts = []
+    for start in range(0, len(data), step):
+        parts.append(base64.b64decode(data[start : start + step]))
+        await asyncio.sleep(0)
+    return b"".join(parts)
+
+
+async def _data_url(image_format: str, data: bytes) -> str:
+    """Build a base64 data URL, decoding to str only once at the end"""
+    prefix = f"data:image/{image_format};base64,".encode("ascii")
+    return (prefix + await _b64encode_chunked(data)).decode("ascii")
+
+
+async def _write_base64_file(path: str, data: str):
+    """Decode base64 image data and write it to path"""
+    decoded = await _b64decode_chunked(data)
+    # File writes release the GIL, so unlike the decode they do benefit
+    # from a worker thread
+    await asyncio.to_thread(Path(path).write_bytes, decoded)
+
 
 class BrowserTools:
     """Browser automation functionality using Playwright and Selenium"""
@@ -36,8 +97,14 @@ class BrowserTools:
         self.temp_dir = Path(temp_dir)
         self.logger = logger
         self.playwright_instance = None
+        self._pw_init_lock = asyncio.Lock()
         self.active_browsers = {}
+        self._page_index = {}  # (browser_id, page_id) -> Page
         self.active_selenium_drivers = {}
+        self._shared_browsers = {}  # (type, headless, args) -> running Browser
+        self._launch_locks = {}  # (type, headless, args) -> asyncio.Lock
+        self._warm_pages = {}  # Browser -> asyncio.Queue of ready pages
+        self._warm_page_tasks = {}  # Browser -> running refill task
 
     def register_tools(self, mcp_server):
         """Register browser automation tools with the MCP server"""
@@ -49,24 +116,44 @@ class BrowserTools:
             headless: bool = True,
             args: List[str] = None,
         ) -> str:
-            """Launch a new Playwright browser instance (chromium, firefox, or webkit). Supports headless, so try to use Headless."""
+            """Get a Playwright browser handle (chromium, firefox, or webkit). The browser process is shared by handles with the same settings, and every page gets its own isolated context. Supports headless, so try to use Headless."""
             if not HAS_PLAYWRIGHT:
                 return "Error: Playwright not installed. Install with: pip install playwright"
 
             try:
                 if not self.playwright_instance:
-                    self.playwright_instance = await async_playwright().start()
+                    # Concurrent first launches must not start two drivers
+                    async with self._pw_init_lock:
+                        if not self.playwright_instance:
+                            self.playwright_instance = await async_playwright().start()
 
                 if browser_type not in ["chromium", "firefox", "webkit"]:
                     return f"Error: Unsupported browser type '{browser_type}'. Use: chromium, firefox, or webkit"
 
-                browser_launcher = getattr(self.playwright_instance, browser_type)
-                launch_options = {"headless": headless}
-
-                if args:
-                    launch_options["args"] = args
+                # Browser processes are shared per launch configuration; each
+                # handle gets isolated pages through its own contexts instead
+                launch_key = (browser_type, headless, tuple(args or ()))
+                # Concurrent launches with the same settings must share one
+                # browser rather than each starting (and leaking) their own
+                launch_lock = self._launch_locks.setdefault(launch_key, asyncio.Lock())
+                async with launch_lock:
+                    browser = self._shared_browsers.get(launch_key)
+                    if browser is None or not browser.is_connected():
+                        self._warm_pages.pop(browser, None)
+                        self._warm_page_tasks.pop(browser, None)
+                        browser_launcher = getattr(
+                            self.playwright_instance, browser_type
+                        )
+                        launch_options = {"headless": headless}
+
+                        if args:
+                            launch_options["args"] = args
+
+                        browser = await browser_launcher.launch(**launch_options)
+                        self._shared_browsers[launch_key] = browser
+                        self._warm_pages[browser] = asyncio.Queue(WARM_PAGE_POOL_SIZE)
+                        self._schedule_warm_pages(browser)
 
-                browser = await browser_launcher.launch(**launch_options)
                 browser_id = f"{browser_type}_{secrets.token_hex(8)}"
 
                 self.active_browsers[browser_id] = {
@@ -90,13 +177,14 @@ class BrowserTools:
 
             try:
                 browser_info = self.active_browsers[browser_id]
-                page = await browser_info["browser"].new_page()
-                await page.set_viewport_size(
-                    {"width": viewport_width, "height": viewport_height}
+                page = await self._new_page(
+                    browser_info["browser"],
+                    {"width": viewport_width, "height": viewport_height},
                 )
 
                 page_id = f"page_{secrets.token_hex(8)}"
                 browser_info["pages"][page_id] = page
+                self._page_index[(browser_id, page_id)] = page
 
                 return f"Page created successfully: {page_id}"
 
@@ -105,9 +193,12 @@ class BrowserTools:
 
         @mcp_server.tool()
         async def playwright_navigate(
-            browser_id: str, page_id: str, url: str, wait_until: str = "load"
+            browser_id: str,
+            page_id: str,
+            url: str,
+            wait_until: str = "domcontentloaded",
         ) -> str:
-            """Navigate to a URL in a Playwright page"""
+            """Navigate to a URL in a Playwright page. Returns once the DOM is parsed; pass wait_until="load" or "networkidle" to also wait for images and other sub-resources"""
             page = self._get_playwright_page(browser_id, page_id)
             if isinstance(page, str):
                 return page
@@ -120,9 +211,9 @@ class BrowserTools:
 
         @mcp_server.tool()
         async def playwright_click(
-            browser_id: str, page_id: str, selector: str, timeout: int = 30000
+            browser_id: str, page_id: str, selector: str, timeout: int = 5000
         ) -> str:
-            """Click an element on a Playwright page"""
+            """Click an element on a Playwright page (timeout in ms; raise it for slow pages)"""
             page = self._get_playwright_page(browser_id, page_id)
             if isinstance(page, str):
                 return page
@@ -139,9 +230,9 @@ class BrowserTools:
             page_id: str,
             selector: str,
             text: str,
-            timeout: int = 30000,
+            timeout: int = 5000,
         ) -> str:
-            """Type text into an element on a Playwright page"""
+            """Type text into an element on a Playwright page (timeout in ms; raise it for slow pages)"""
             page = self._get_playwright_page(browser_id, page_id)
             if isinstance(page, str):
                 return page
@@ -159,42 +250,72 @@ class BrowserTools:
             filename: str = None,
             full_page: bool = False,
             return_base64: bool = False,
+            image_format: str = "jpeg",
+            quality: int = 80,
+            selector: str = None,
+            timeout: int = 5000,
         ) -> str:
-            """Take a screenshot of a Playwright page"""
+            """Take a screenshot of a Playwright page. JPEG (default) is much faster to encode; use image_format="png" for lossless output"""
             page = self._get_playwright_page(browser_id, page_id)
             if isinstance(page, str):
                 return page
 
-            try:
-                screenshot_options = {"full_page": full_page}
+            if filename:
+                # An explicit extension decides the format
+                suffix = Path(filename).suffix.lower()
+                image_format = SCREENSHOT_FORMATS.get(suffix, image_format)
+            if image_format not in SCREENSHOT_EXTENSIONS:
+                return f"Error: Unsupported image format '{image_format}'. Use: jpeg or png"
 
-                if filename:
-                    filepath = self.temp_dir / filename
-                    screenshot_options["path"] = str(filepath)
-                    await page.screenshot(**screenshot_options)
-                    result = f"Screenshot saved: {filename}"
+            try:
+                if return_base64 and not filename:
+                    save_path = None
                 else:
-                    screenshot_bytes = await page.screenshot(**screenshot_options)
-                    if return_base64:
-                        screenshot_b64 = base64.b64encode(screenshot_bytes).decode()
-                        return f"data:image/png;base64,{screenshot_b64}"
-                    else:
-                        filename = f"screenshot_{secrets.token_hex(8)}.png"
-                        filepath = self.temp_dir / filename
-                        with open(filepath, "wb") as f:
-                            f.write(screenshot_bytes)
-                        result = f"Screenshot saved: {filename}"
-
-                return result
+                    extension = SCREENSHOT_EXTENSIONS[image_format]
+                    if not filename:
+                        filename = f"screenshot_{secrets.token_hex(8)}{extension}"
+                    save_path = str(self.temp_dir / filename)
+
+                browser_type = self.active_browsers[browser_id]["type"]
+                if browser_type == "chromium" and not selector:
+                    # Chromium hands back base64 over CDP directly, without
+                    # Playwright's extra stabilisation waits
+                    screenshot_b64 = await self._capture_cdp_screenshot(
+                        page, image_format, quality, full_page
+                    )
+                    if save_path is None:
+                        return f"data:image/{image_format};base64,{screenshot_b64}"
+                    await _write_base64_file(save_path, screenshot_b64)
+                    return f"Screenshot saved: {filename}"
+
+                screenshot_options = {"full_page": full_page, "type": image_format}
+                if image_format == "jpeg":
+                    screenshot_options["quality"] = quality
+
+                target = page
+                if selector:
+                    # Capture only the element's box instead of the whole page
+                    target = await page.wait_for_selector(selector, timeout=timeout)
+                    del screenshot_options["full_page"]
+
+                if save_path is None:
+                    screenshot_bytes = await target.screenshot(**screenshot_options)
+                    return await _data_url(image_format, screenshot_bytes)
+
+                # Have Playwright write the file itself instead of copying the
+                # image through Python first
+                screenshot_options["path"] = save_path
+                await target.screenshot(**screenshot_options)
+                return f"Screenshot saved: {filename}"
 
             except Exception as e:
                 return f"Error taking screenshot: {str(e)}"
 
         @mcp_server.tool()
         async def playwright_get_text(
-            browser_id: str, page_id: str, selector: str, timeout: int = 30000
+            browser_id: str, page_id: str, selector: str, timeout: int = 5000
         ) -> str:
-            """Get text content from an element on a Playwright page"""
+            """Get text content from an element on a Playwright page (timeout in ms; raise it for slow pages)"""
             page = self._get_playwright_page(browser_id, page_id)
             if isinstance(page, str):
                 return page
@@ -206,19 +327,54 @@ class BrowserTools:
             except Exception as e:
                 return f"Error getting text from {selector}: {str(e)}"
 
+        @mcp_server.tool()
+        async def playwright_get_page_metrics(
+            browser_id: str, page_id: str, selector: str = None, timeout: int = 5000
+        ) -> str:
+            """Get the viewport size, full document size and optionally an element's bounding box. Much cheaper than a screenshot when only the layout is needed"""
+            page = self._get_playwright_page(browser_id, page_id)
+            if isinstance(page, str):
+                return page
+
+            try:
+                metrics = {
+                    "viewport": page.viewport_size,
+                    "document": await page.evaluate(
+                        "() => ({width: document.documentElement.scrollWidth,"
+                        " height: document.documentElement.scrollHeight})"
+                    ),
+                }
+                if selector:
+                    element = await page.wait_for_selector(selector, timeout=timeout)
+                    metrics["element"] = await element.bounding_box()
+                return dumps(metrics)
+            except Exception as e:
+                return f"Error getting page metrics: {str(e)}"
+
         # Selenium tools
         @mcp_server.tool()
         async def selenium_launch_driver(
             browser_type: str = "chrome",
             headless: bool = True,
             options: List[str] = None,
+            profile_name: str = None,
         ) -> str:
-            """Launch a Selenium WebDriver (chrome or firefox)"""
+            """Launch a Selenium WebDriver (chrome or firefox). Pass profile_name to reuse a profile (HTTP cache, cookies) across launches; a profile can only be used by one driver at a time, so close the previous driver with selenium_close_driver first. Profiles live in the server's temp directory and are lost when the server exits"""
             if not HAS_SELENIUM:
                 return (
                     "Error: Selenium not installed. Install with: pip install selenium"
                 )
 
+            profile_dir = None
+            if profile_name:
+                if Path(profile_name).name != profile_name:
+                    return f"Error: Invalid profile name '{profile_name}'"
+                for other_id, other_info in self.active_selenium_drivers.items():
+                    if other_info.get("profile") == profile_name:
+                        return f"Error: Profile '{profile_name}' is in use by driver {other_id}. Close it with selenium_close_driver first"
+                profile_dir = self.temp_dir / "selenium_profiles" / profile_name
+                profile_dir.mkdir(parents=True, exist_ok=True)
+
             try:
                 driver_id = f"{browser_type}_{secrets.token_hex(8)}"
 
@@ -228,6 +384,8 @@ class BrowserTools:
                         chrome_options.add_argument("--headless")
                     chrome_options.add_argument("--no-sandbox")
                     chrome_options.add_argument("--disable-dev-shm-usage")
+                    if profile_dir:
+                        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
 
                     if options:
                         for option in options:
@@ -239,6 +397,10 @@ class BrowserTools:
                     firefox_options = FirefoxOptions()
                     if headless:
                         firefox_options.add_argument("--headless")
+                    if profile_dir:
+                        # Use the directory in place; FirefoxProfile would copy it
+                        firefox_options.add_argument("-profile")
+                        firefox_options.add_argument(str(profile_dir))
 
                     if options:
                         for option in options:
@@ -252,6 +414,8 @@ class BrowserTools:
                 self.active_selenium_drivers[driver_id] = {
                     "driver": driver,
                     "type": browser_type,
+                    "profile": profile_name,
+                    "waits": {},  # timeout -> WebDriverWait
                 }
 
                 return f"Selenium driver launched successfully: {driver_id}"
@@ -274,17 +438,17 @@ class BrowserTools:
 
         @mcp_server.tool()
         async def selenium_click(
-            driver_id: str, selector: str, by: str = "css", timeout: int = 10
+            driver_id: str, selector: str, by: str = "css", timeout: int = 3
         ) -> str:
-            """Click an element using Selenium"""
+            """Click an element using Selenium (timeout in seconds; raise it for slow pages)"""
             if driver_id not in self.active_selenium_drivers:
                 return f"Selenium driver {driver_id} not found"
 
             try:
-                driver = self.active_selenium_drivers[driver_id]["driver"]
-                wait = WebDriverWait(driver, timeout)
+                driver_info = self.active_selenium_drivers[driver_id]
+                wait = self._get_selenium_wait(driver_info, timeout)
 
-                by_method = getattr(By, by.upper(), By.CSS_SELECTOR)
+                by_method = _resolve_by(by)
                 element = wait.until(EC.element_to_be_clickable((by_method, selector)))
                 element.click()
 
@@ -299,17 +463,17 @@ class BrowserTools:
             text: str,
             by: str = "css",
             clear: bool = True,
-            timeout: int = 10,
+            timeout: int = 3,
         ) -> str:
-            """Type text into an element using Selenium"""
+            """Type text into an element using Selenium (timeout in seconds; raise it for slow pages)"""
             if driver_id not in self.active_selenium_drivers:
                 return f"Selenium driver {driver_id} not found"
 
             try:
-                driver = self.active_selenium_drivers[driver_id]["driver"]
-                wait = WebDriverWait(driver, timeout)
+                driver_info = self.active_selenium_drivers[driver_id]
+                wait = self._get_selenium_wait(driver_info, timeout)
 
-                by_method = getattr(By, by.upper(), By.CSS_SELECTOR)
+                by_method = _resolve_by(by)
                 element = wait.until(
                     EC.presence_of_element_located((by_method, selector))
                 )
@@ -322,6 +486,20 @@ class BrowserTools:
             except Exception as e:
                 return f"Error typing into {selector}: {str(e)}"
 
+        @mcp_server.tool()
+        async def selenium_close_driver(driver_id: str) -> str:
+            """Quit a Selenium WebDriver and free its profile for the next launch"""
+            driver_info = self.active_selenium_drivers.pop(driver_id, None)
+            if driver_info is None:
+                return f"Selenium driver {driver_id} not found"
+
+            try:
+                # quit() waits for the browser process to exit
+                await asyncio.to_thread(driver_info["driver"].quit)
+                return f"Selenium driver {driver_id} closed"
+            except Exception as e:
+                return f"Error closing Selenium driver {driver_id}: {str(e)}"
+
         @mcp_server.tool()
         async def list_browser_instances() -> str:
             """List all active browser instances"""
@@ -329,15 +507,80 @@ class BrowserTools:
                 "playwright_browsers": list(self.active_browsers.keys()),
                 "selenium_drivers": list(self.active_selenium_drivers.keys()),
             }
-            return json.dumps(instances, indent=2)
+            return dumps(instances)
+
+    async def _new_page(self, browser, viewport: Dict[str, int]):
+        """Open a page in its own context, preferring a pre-warmed one"""
+        warm_pages = self._warm_pages.get(browser)
+        if viewport == DEFAULT_VIEWPORT and warm_pages and not warm_pages.empty():
+            page = warm_pages.get_nowait()
+            self._schedule_warm_pages(browser)
+            return page
+
+        # A context per page keeps cookies and cache isolated without
+        # paying for another browser process
+        context = await browser.new_context(viewport=viewport)
+        return await context.new_page()
+
+    def _schedule_warm_pages(self, browser):
+        """Top up the browser's warm page pool in the background"""
+        task = self._warm_page_tasks.get(browser)
+        if task is None or task.done():
+            self._warm_page_tasks[browser] = asyncio.create_task(
+                self._fill_warm_pages(browser)
+            )
+
+    async def _fill_warm_pages(self, browser):
+        warm_pages = self._warm_pages[browser]
+        try:
+            while not warm_pages.full() and browser.is_connected():
+                context = await browser.new_context(viewport=DEFAULT_VIEWPORT)
+                warm_pages.put_nowait(await context.new_page())
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not pre-warm browser pages: {e}")
+
+    async def _capture_cdp_screenshot(
+        self, page, image_format: str, quality: int, full_page: bool
+    ) -> str:
+        """Capture a Chromium page with Page.captureScreenshot, returning base64"""
+        cdp = await page.context.new_cdp_session(page)
+        try:
+            params = {"format": image_format}
+            if image_format == "jpeg":
+                params["quality"] = quality
+            if full_page:
+                metrics = await cdp.send("Page.getLayoutMetrics")
+                content = metrics["cssContentSize"]
+                params["captureBeyondViewport"] = True
+                params["clip"] = {
+                    "x": 0,
+                    "y": 0,
+                    "width": content["width"],
+                    "height": content["height"],
+                    "scale": 1,
+                }
+            result = await cdp.send("Page.captureScreenshot", params)
+            return result["data"]
+        finally:
+            await cdp.detach()
+
+    @staticmethod
+    def _get_selenium_wait(driver_info: Dict[str, Any], timeout: int):
+        """Reuse one WebDriverWait per driver and timeout"""
+        wait = driver_info["waits"].get(timeout)
+        if wait is None:
+            wait = driver_info["waits"][timeout] = WebDriverWait(
+                driver_info["driver"], timeout
+            )
+        return wait
 
     def _get_playwright_page(self, browser_id: str, page_id: str):
         """Helper to get Playwright page"""
+        page = self._page_index.get((browser_id, page_id))
+        if page is not None:
+            return page
+
         if browser_id not in self.active_browsers:
             return f"Browser {browser_id} not found"
-
-        browser_info = self.active_browsers[browser_id]
-        if page_id not in browser_info["pages"]:
-            return f"Page {page_id} not found in browser {browser_id}"
-
-        return browser_info["pages"][page_id]
+        return f"Page {page_id} not found in browser {browser_id}"
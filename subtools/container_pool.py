@@ -0,0 +1,152 @@
+"""
+Pool of idle Docker containers kept warm for reuse
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+
+class ContainerPool:
+    """Keeps released containers running per image so they can be borrowed again
+
+    Containers are not reset when released: files outside the shared
+    workspace, installed packages and running processes carry over to the
+    next borrower, so pooled containers are not isolated from each other.
+    """
+
+    def __init__(
+        self,
+        docker_client,
+        max_idle_per_image: int = 2,
+        idle_timeout: float = 300,
+        logger=None,
+    ):
+        self.docker_client = docker_client
+        self.max_idle_per_image = max_idle_per_image
+        self.idle_timeout = idle_timeout
+        self.logger = logger
+        self._idle = defaultdict(list)  # image -> [(container, released_at)]
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "released": 0, "reaped": 0}
+        self._reaper = None
+        self._stop_reaper = threading.Event()
+
+    def borrow(self, image: str, pool_key: str = None, **run_kwargs):
+        """Return an idle running container for the image, or start a new one
+
+        pool_key separates containers of the same image that were prepared
+        differently; it defaults to the image name.
+        """
+        self.reap()
+        key = pool_key or image
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    break
+                container, _ = idle.pop()
+
+            try:
+                container.reload()
+                if container.status == "running":
+                    with self._lock:
+                        self._stats["reused"] += 1
+                    return container
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Discarding pooled container: {e}")
+            self._discard(container)
+
+        container = self.docker_client.containers.run(image, **run_kwargs)
+        with self._lock:
+            self._stats["created"] += 1
+        return container
+
+    def release(self, container, image: str) -> bool:
+        """Return a container to the pool, or False if the image's pool is full
+
+        image is the pool key the container was borrowed under. Containers that
+        are no longer running are rejected, so the caller removes them.
+        """
+        try:
+            container.reload()
+            if container.status != "running":
+                return False
+        except Exception:
+            return False
+
+        with self._lock:
+            idle = self._idle[image]
+            if len(idle) >= self.max_idle_per_image:
+                return False
+            idle.append((container, time.monotonic()))
+            self._stats["released"] += 1
+            self._start_reaper()
+
+        self.reap()
+        return True
+
+    def _start_reaper(self):
+        """Start the background reaper thread if it is not running (lock held)"""
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._stop_reaper.clear()
+        self._reaper = threading.Thread(
+            target=self._reap_periodically, name="container-pool-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def _reap_periodically(self):
+        """Reap idle containers on a schedule so they expire without pool traffic"""
+        interval = max(self.idle_timeout / 2, 1.0)
+        while not self._stop_reaper.wait(interval):
+            try:
+                self.reap()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Error reaping pooled containers: {e}")
+
+    def reap(self) -> int:
+        """Stop and remove containers that have been idle longer than idle_timeout"""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._lock:
+            for idle in self._idle.values():
+                expired.extend(c for c, released_at in idle if released_at <= cutoff)
+                idle[:] = [entry for entry in idle if entry[1] > cutoff]
+            self._stats["reaped"] += len(expired)
+
+        for container in expired:
+            self._discard(container)
+        return len(expired)
+
+    def _discard(self, container):
+        """Stop and remove a container that is leaving the pool"""
+        try:
+            container.stop(timeout=2)
+            container.remove()
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Error removing pooled container: {e}")
+
+    def drain(self) -> List:
+        """Stop the reaper, then remove every idle container and return them"""
+        self._stop_reaper.set()
+        with self._lock:
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.join()
+        with self._lock:
+            containers = [c for idle in self._idle.values() for c, _ in idle]
+            self._idle.clear()
+        return containers
+
+    def get_stats(self) -> Dict[str, int]:
+        """Pool counters plus the number of currently idle containers"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(idle) for idle in self._idle.values())
+        return stats
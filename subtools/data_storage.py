@@ -1,6 +1,32 @@
 import time
 from fastmcp import FastMCP
 import os
+import mmap
+import asyncio
+import aiofiles
+
+WRITE_BUFFER_SIZE = 1 << 16  # 64 KiB, so large saves go out in few syscalls
+MMAP_READ_THRESHOLD = 1 << 16  # files this big are mapped instead of read()
+
+def _read_mapped(path: str):
+    # Decode straight from the page cache, skipping the intermediate bytes copy
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    # Translate newlines the same way a text-mode read() does
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _list_entries(path: str):
+    # scandir hands back the directory entries with their stat info attached
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            stat = entry.stat()
+            entries.append({"name": entry.name, "size": stat.st_size, "mtime": stat.st_mtime})
+    return entries
+
 class MarkdownTools:
     def __init__(self, markdown_path:str="/"):
         self.base_path = markdown_path
@@ -10,6 +36,16 @@ class MarkdownTools:
         self.artifacts = f'{markdown_path}/artifacts'
         self.markdown = f'{markdown_path}/markdown'
         self.other_data = f'{markdown_path}/other_data'
+        self._list_cache = {}  # directory -> (st_mtime_ns, entries)
+    def _cached_entries(self, path: str):
+        # Directory mtime changes whenever a file is added, removed or renamed
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._list_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        entries = _list_entries(path)
+        self._list_cache[path] = (mtime, entries)
+        return entries
     def add_mcp_tools(self, mcp: FastMCP):
         @mcp.tool()
         async def save_artifact(
@@ -21,8 +57,10 @@ class MarkdownTools:
             Recommended only for Artifacts or sections of code.
             """
             path = f"{self.artifacts}/{filename}"
-            with open(path, 'w') as fp:
-                fp.write(artifact)
+            async with aiofiles.open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as fp:
+                await fp.write(artifact)
+            # Overwrites don't touch the directory mtime but do change sizes
+            self._list_cache.pop(self.artifacts, None)
             return f"success! The data has been written to {filename}."
         @mcp.tool()
         async def save_markdown(
@@ -34,11 +72,12 @@ class MarkdownTools:
             Only Markdown please!
             
             """
-            if data.split('.')[1] != ".md":
+            if not filename.endswith(".md"):
                 return "Only Markdown supported."
             path = f"{self.markdown}/{filename}"
-            with open(path, 'w') as fp:
-                fp.write(data)
+            async with aiofiles.open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as fp:
+                await fp.write(data)
+            self._list_cache.pop(self.markdown, None)
             return f"success! The data has been written to {filename}"
         @mcp.tool()
         async def list(
@@ -48,8 +87,8 @@ class MarkdownTools:
 
             
             """
-            artifacts = os.listdir(self.artifacts)
-            markdowns = os.listdir(self.markdown)
+            artifacts = self._cached_entries(self.artifacts)
+            markdowns = self._cached_entries(self.markdown)
             return {
                 "artifacts":artifacts,
                 "markdowns":markdowns
@@ -65,8 +104,10 @@ class MarkdownTools:
             
             """
             if artifact:
-                with open(f'{self.artifacts}/{filename}', 'r') as f:
-                    return f.read()
+                path = f'{self.artifacts}/{filename}'
             else:
-                with open(f'{self.markdown}/{filename}', 'r') as f:
-                    return f.read()
\ No newline at end of file
+                path = f'{self.markdown}/{filename}'
+            if os.stat(path).st_size >= MMAP_READ_THRESHOLD:
+                return await asyncio.to_thread(_read_mapped, path)
+            async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+                return await f.read()
\ No newline at end of file
@@ -2,12 +2,249 @@
 Development tools for coding, project scaffolding, and AI-assisted development
 """
 
+import asyncio
+import bisect
+import functools
+import hashlib
+import io
 import json
 import os
+import posixpath
+import re
+import shlex
+import tarfile
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
+import aiofiles
+import docker
+
+_MAIN_PY_TEMPLATE = '"""\n{project_name} - Main application\n"""\n\ndef main():\n    print("Hello from {project_name}!")\n\nif __name__ == "__main__":\n    main()\n'
+
+_SETUP_PY_TEMPLATE = """from setuptools import setup, find_packages
+
+setup(
+    name="{project_name}",
+    version="0.1.0",
+    description="{project_name} application",
+    packages=find_packages(where="src"),
+    package_dir={{"": "src"}},
+    python_requires=">=3.8",
+    install_requires=open("requirements.txt").read().splitlines(),
+)"""
+
+_INDEX_JS_TEMPLATE = """const express = require('express');
+const app = express();
+const PORT = process.env.PORT || 3000;
+
+app.get('/', (req, res) => {{
+    res.json({{ message: 'Hello from {project_name}!' }});
+}});
+
+app.listen(PORT, () => {{
+    console.log(`{project_name} server running on port ${{PORT}}`);
+}});
+
+module.exports = app;
+"""
+
+_POM_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0"
+         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+         xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 
+         http://maven.apache.org/xsd/maven-4.0.0.xsd">
+    <modelVersion>4.0.0</modelVersion>
+    
+    <groupId>com.example</groupId>
+    <artifactId>{artifact_id}</artifactId>
+    <version>1.0.0</version>
+    
+    <properties>
+        <maven.compiler.source>17</maven.compiler.source>
+        <maven.compiler.target>17</maven.compiler.target>
+    </properties>
+    
+    <dependencies>
+        <dependency>
+            <groupId>junit</groupId>
+            <artifactId>junit</artifactId>
+            <version>4.13.2</version>
+            <scope>test</scope>
+        </dependency>
+    </dependencies>
+</project>"""
+
+_MAIN_JAVA_TEMPLATE = """package com.example.{artifact_id};
+
+public class Main {{
+    public static void main(String[] args) {{
+        System.out.println("Hello from {project_name}!");
+    }}
+}}"""
+
+_README_TEMPLATE = """# {project_name}
+
+## Description
+{project_name} application built with {language}
+
+## Features
+{features}
+
+## Installation
+```bash
+# Install dependencies
+{install}
+```
+
+## Usage
+```bash
+# Run the application
+{run}
+```
+
+## Development
+```bash
+# Run tests
+{test}
+```
+"""
+
+# (install, run, test) commands per language; anything else gets Go's
+_README_COMMANDS = {
+    "python": ("pip install -r requirements.txt", "python src/main.py", "pytest"),
+    "node": ("npm install", "npm start", "npm test"),
+    "java": ("mvn install", "mvn exec:java", "mvn test"),
+    "rust": ("cargo build", "cargo run", "cargo test"),
+    "golang": ("go mod tidy", "go run .", "go test"),
+}
+
+_GITIGNORE = {
+    "python": "__pycache__/\n*.pyc\n*.pyo\n*.pyd\n.env\n.venv/\ndist/\nbuild/\n*.egg-info/",
+    "node": "node_modules/\nnpm-debug.log*\n.env\ndist/\nbuild/",
+    "java": "target/\n*.class\n*.jar\n*.war\n*.ear",
+    "golang": "bin/\n*.exe\ngo.sum",
+    "rust": "target/\nCargo.lock",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _render_template(
+    language: str, project_name: str, features: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """Directories and (path, content) files of a project template
+
+    Paths are relative to the project directory. Results are cached, so
+    repeated requests for the same project skip rebuilding the file bodies.
+    """
+    dirs = [""]
+    files = []
+
+    if language == "python":
+        dirs.extend(("src", "tests", "docs"))
+
+        requirements = ["requests>=2.31.0"]
+        if "testing" in features:
+            requirements.extend(["pytest>=7.4.0", "pytest-cov>=4.1.0"])
+        if "linting" in features:
+            requirements.extend(["black>=23.0.0", "flake8>=6.0.0", "mypy>=1.5.0"])
+        if "fastapi" in features:
+            requirements.extend(["fastapi>=0.104.0", "uvicorn>=0.24.0"])
+        if "django" in features:
+            requirements.append("Django>=4.2.0")
+
+        files.append(("requirements.txt", "\n".join(requirements)))
+        files.append(
+            ("src/main.py", _MAIN_PY_TEMPLATE.format(project_name=project_name))
+        )
+        files.append(("setup.py", _SETUP_PY_TEMPLATE.format(project_name=project_name)))
+
+    elif language == "node":
+        dirs.extend(("src", "tests"))
+
+        dependencies = {"express": "^4.18.0"}
+        dev_dependencies = {"nodemon": "^3.0.0", "jest": "^29.5.0"}
+
+        if "typescript" in features:
+            dependencies["typescript"] = "^5.2.0"
+            dev_dependencies["@types/node"] = "^20.0.0"
+            dev_dependencies["ts-node"] = "^10.9.0"
+
+        package_json = {
+            "name": project_name.lower().replace(" ", "-"),
+            "version": "1.0.0",
+            "description": f"{project_name} application",
+            "main": "src/index.js",
+            "scripts": {
+                "start": "node src/index.js",
+                "dev": "nodemon src/index.js",
+                "test": "jest",
+            },
+            "dependencies": dependencies,
+            "devDependencies": dev_dependencies,
+        }
+
+        files.append(("package.json", json.dumps(package_json, indent=2)))
+        files.append(
+            ("src/index.js", _INDEX_JS_TEMPLATE.format(project_name=project_name))
+        )
+
+    elif language == "java":
+        artifact_id = project_name.lower()
+        java_package_dir = f"src/main/java/com/example/{artifact_id}"
+        dirs.extend((java_package_dir, f"src/test/java/com/example/{artifact_id}"))
+
+        files.append(("pom.xml", _POM_XML_TEMPLATE.format(artifact_id=artifact_id)))
+        files.append(
+            (
+                f"{java_package_dir}/Main.java",
+                _MAIN_JAVA_TEMPLATE.format(
+                    artifact_id=artifact_id, project_name=project_name
+                ),
+            )
+        )
+
+    # Common files for all languages
+    install, run, test = _README_COMMANDS.get(language, _README_COMMANDS["golang"])
+    readme = _README_TEMPLATE.format(
+        project_name=project_name,
+        language=language,
+        features=(
+            "\n".join(f"- {feature}" for feature in features)
+            if features
+            else "- Basic application structure"
+        ),
+        install=install,
+        run=run,
+        test=test,
+    )
+    files.append(("README.md", readme))
+    files.append((".gitignore", _GITIGNORE.get(language, "")))
+
+    return tuple(dirs), tuple(files)
+
+
+# Same limit as the kernel's ELOOP check when following symlinks
+_MAX_SYMLINK_HOPS = 40
+
+# Python analysis rules: print() calls with a string literal, and wildcard imports
+_PY_PRINT = re.compile(r'\s*print\(.*"')
+_PY_RULE_LINES = re.compile(r'^(?=[^\S\n]*print\([^\n]*"|[^\n]*import \*)[^\n]*', re.M)
+
+
+def _make_dirs(dirs: Set[Path]):
+    """Create each leaf directory once; parents come along with parents=True"""
+    for path in dirs:
+        if not any(path in other.parents for other in dirs):
+            path.mkdir(parents=True, exist_ok=True)
+
+
+async def _write_text(path: Path, content: str):
+    """Write a text file without blocking the event loop"""
+    async with aiofiles.open(path, "w") as f:
+        await f.write(content)
+
 
 class DevelopmentTools:
     """Development and coding assistance tools"""
@@ -19,11 +256,18 @@ class DevelopmentTools:
         temp_dir: str,
         logger=None,
         baseurl="",
+        container_pool=None,
     ):
         self.docker_client = docker_client
         self.active_containers = active_containers
         self.temp_dir = Path(temp_dir)
         self.logger = logger
+        self.container_pool = container_pool
+        self._provisioned = set()  # ids of containers with packages installed
+        self._image_cache = {}  # config hash -> baked image tag
+        self._image_lock = threading.Lock()
+        self._name_index = {}  # container name -> id, for containers made here
+        self._sorted_ids = []  # ids of containers made here, for prefix lookups
 
     def register_tools(self, mcp_server):
         """Register development tools with the MCP server"""
@@ -32,7 +276,7 @@ class DevelopmentTools:
         async def create_dev_environment(
             language: str, project_name: str, features: List[str] = None
         ) -> str:
-            """Create a development environment with pre-configured tools"""
+            """Create a development environment with pre-configured tools. Deleted environments are kept in a pool and handed, without being reset, to the next environment for the same language"""
             try:
                 # Language-specific base images
                 language_configs = {
@@ -78,47 +322,61 @@ class DevelopmentTools:
                     return f"Unsupported language: {language}. Supported: {', '.join(language_configs.keys())}"
 
                 config = language_configs[language]
-                container_name = f"dev_{language}_{project_name}_{int(time.time())}"
-
-                # Create container
-                container = self.docker_client.containers.run(
-                    image=config["image"],
-                    name=container_name,
-                    detach=True,
-                    stdin_open=True,
-                    tty=True,
-                    working_dir="/workspace",
-                    volumes={"/tmp/workspace": {"bind": "/workspace", "mode": "rw"}},
-                    command=(
+                created_at = time.time()
+                container_name = f"dev_{language}_{project_name}_{int(created_at)}"
+
+                run_kwargs = {
+                    "detach": True,
+                    "stdin_open": True,
+                    "tty": True,
+                    "working_dir": "/workspace",
+                    "volumes": {"/tmp/workspace": {"bind": "/workspace", "mode": "rw"}},
+                    "command": (
                         "/bin/bash" if "alpine" not in config["image"] else "/bin/sh"
                     ),
+                }
+
+                # Image builds and container startup can take minutes, so
+                # they run off the event loop
+                pool_key = f"dev-{language}"
+                container = await asyncio.to_thread(
+                    self._start_dev_container,
+                    config,
+                    pool_key,
+                    container_name,
+                    run_kwargs,
                 )
 
                 # Store container info
                 self.active_containers[container.id] = {
                     "container": container,
                     "name": container_name,
-                    "created_at": time.time(),
+                    "created_at": created_at,
                     "image": config["image"],
+                    "pooled": self.container_pool is not None,
+                    "pool_key": pool_key,
+                    "owned_by_server": True,
                 }
+                self._index_container(container.id, container_name)
 
-                # Install packages and run setup commands
-                if config["packages"]:
-                    if "alpine" in config["image"]:
-                        install_cmd = (
-                            f"apk add --no-cache {' '.join(config['packages'])}"
-                        )
-                    else:
-                        install_cmd = f"apt-get update && apt-get install -y {' '.join(config['packages'])}"
-
-                    container.exec_run(install_cmd)
-
-                for cmd in config["setup_commands"]:
-                    container.exec_run(cmd)
-
-                # Create project structure
+                # Create the project structure and, unless this is a reused
+                # container that already has them, install packages and run
+                # setup commands, all in a single exec
                 project_dir = f"/workspace/{project_name}"
-                container.exec_run(f"mkdir -p {project_dir}")
+                commands = [f"mkdir -p {shlex.quote(project_dir)}"]
+                provision = container.id not in self._provisioned
+                if provision:
+                    if config["packages"]:
+                        commands.append(self._install_command(config))
+                    commands.extend(config["setup_commands"])
+
+                result = await asyncio.to_thread(
+                    container.exec_run,
+                    ["sh", "-c", " && ".join(commands)],
+                    environment={"DEBIAN_FRONTEND": "noninteractive"},
+                )
+                if provision and result.exit_code == 0:
+                    self._provisioned.add(container.id)
 
                 return f"Development environment created: {container_name} ({container.id[:12]})"
 
@@ -132,210 +390,20 @@ class DevelopmentTools:
             """Generate a project template with common structure and files"""
             try:
                 project_path = Path("/tmp/workspace") / project_name
-                project_path.mkdir(parents=True, exist_ok=True)
-
                 features = features or []
 
-                if language == "python":
-                    # Create Python project structure
-                    (project_path / "src").mkdir(exist_ok=True)
-                    (project_path / "tests").mkdir(exist_ok=True)
-                    (project_path / "docs").mkdir(exist_ok=True)
-
-                    # requirements.txt
-                    requirements = ["requests>=2.31.0"]
-                    if "testing" in features:
-                        requirements.extend(["pytest>=7.4.0", "pytest-cov>=4.1.0"])
-                    if "linting" in features:
-                        requirements.extend(
-                            ["black>=23.0.0", "flake8>=6.0.0", "mypy>=1.5.0"]
-                        )
-                    if "fastapi" in features:
-                        requirements.extend(["fastapi>=0.104.0", "uvicorn>=0.24.0"])
-                    if "django" in features:
-                        requirements.append("Django>=4.2.0")
-
-                    with open(project_path / "requirements.txt", "w") as f:
-                        f.write("\n".join(requirements))
-
-                    # main.py
-                    main_content = f'"""\n{project_name} - Main application\n"""\n\ndef main():\n    print("Hello from {project_name}!")\n\nif __name__ == "__main__":\n    main()\n'
-                    with open(project_path / "src" / "main.py", "w") as f:
-                        f.write(main_content)
-
-                    # setup.py
-                    setup_content = f"""from setuptools import setup, find_packages
-
-setup(
-    name="{project_name}",
-    version="0.1.0",
-    description="{project_name} application",
-    packages=find_packages(where="src"),
-    package_dir={{"": "src"}},
-    python_requires=">=3.8",
-    install_requires=open("requirements.txt").read().splitlines(),
-)"""
-                    with open(project_path / "setup.py", "w") as f:
-                        f.write(setup_content)
-
-                elif language == "node":
-                    # Create Node.js project structure
-                    (project_path / "src").mkdir(exist_ok=True)
-                    (project_path / "tests").mkdir(exist_ok=True)
-
-                    # package.json
-                    dependencies = {"express": "^4.18.0"}
-                    dev_dependencies = {"nodemon": "^3.0.0", "jest": "^29.5.0"}
-
-                    if "typescript" in features:
-                        dependencies["typescript"] = "^5.2.0"
-                        dev_dependencies["@types/node"] = "^20.0.0"
-                        dev_dependencies["ts-node"] = "^10.9.0"
-
-                    package_json = {
-                        "name": project_name.lower().replace(" ", "-"),
-                        "version": "1.0.0",
-                        "description": f"{project_name} application",
-                        "main": "src/index.js",
-                        "scripts": {
-                            "start": "node src/index.js",
-                            "dev": "nodemon src/index.js",
-                            "test": "jest",
-                        },
-                        "dependencies": dependencies,
-                        "devDependencies": dev_dependencies,
-                    }
-
-                    with open(project_path / "package.json", "w") as f:
-                        f.write(json.dumps(package_json, indent=2))
-
-                    # index.js
-                    with open(project_path / "src" / "index.js", "w") as f:
-                        f.write(
-                            f"""const express = require('express');
-const app = express();
-const PORT = process.env.PORT || 3000;
-
-app.get('/', (req, res) => {{
-    res.json({{ message: 'Hello from {project_name}!' }});
-}});
-
-app.listen(PORT, () => {{
-    console.log(`{project_name} server running on port ${{PORT}}`);
-}});
-
-module.exports = app;
-"""
-                        )
-
-                elif language == "java":
-                    # Create Java project structure
-                    java_package_path = (
-                        project_path
-                        / "src"
-                        / "main"
-                        / "java"
-                        / "com"
-                        / "example"
-                        / project_name.lower()
-                    )
-                    java_package_path.mkdir(parents=True, exist_ok=True)
-
-                    test_package_path = (
-                        project_path
-                        / "src"
-                        / "test"
-                        / "java"
-                        / "com"
-                        / "example"
-                        / project_name.lower()
-                    )
-                    test_package_path.mkdir(parents=True, exist_ok=True)
-
-                    # pom.xml for Maven
-                    pom_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0"
-         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-         xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 
-         http://maven.apache.org/xsd/maven-4.0.0.xsd">
-    <modelVersion>4.0.0</modelVersion>
-    
-    <groupId>com.example</groupId>
-    <artifactId>{project_name.lower()}</artifactId>
-    <version>1.0.0</version>
-    
-    <properties>
-        <maven.compiler.source>17</maven.compiler.source>
-        <maven.compiler.target>17</maven.compiler.target>
-    </properties>
-    
-    <dependencies>
-        <dependency>
-            <groupId>junit</groupId>
-            <artifactId>junit</artifactId>
-            <version>4.13.2</version>
-            <scope>test</scope>
-        </dependency>
-    </dependencies>
-</project>"""
-
-                    with open(project_path / "pom.xml", "w") as f:
-                        f.write(pom_content)
-
-                    # Main.java
-                    main_java = f"""package com.example.{project_name.lower()};
-
-public class Main {{
-    public static void main(String[] args) {{
-        System.out.println("Hello from {project_name}!");
-    }}
-}}"""
-
-                    with open(java_package_path / "Main.java", "w") as f:
-                        f.write(main_java)
-
-                # Create common files for all languages
-                with open(project_path / "README.md", "w") as f:
-                    f.write(
-                        f"""# {project_name}
-
-## Description
-{project_name} application built with {language}
-
-## Features
-{chr(10).join(f"- {feature}" for feature in features) if features else "- Basic application structure"}
-
-## Installation
-```bash
-# Install dependencies
-{"pip install -r requirements.txt" if language == "python" else "npm install" if language == "node" else "mvn install" if language == "java" else "cargo build" if language == "rust" else "go mod tidy"}
-```
-
-## Usage
-```bash
-# Run the application
-{"python src/main.py" if language == "python" else "npm start" if language == "node" else "mvn exec:java" if language == "java" else "cargo run" if language == "rust" else "go run ."}
-```
+                dirs, files = _render_template(language, project_name, tuple(features))
+                await asyncio.to_thread(
+                    _make_dirs, {project_path / path for path in dirs}
+                )
 
-## Development
-```bash
-# Run tests
-{"pytest" if language == "python" else "npm test" if language == "node" else "mvn test" if language == "java" else "cargo test" if language == "rust" else "go test"}
-```
-"""
+                # The files are independent, so write them concurrently
+                await asyncio.gather(
+                    *(
+                        _write_text(project_path / path, content)
+                        for path, content in files
                     )
-
-                # .gitignore
-                gitignore_content = {
-                    "python": "__pycache__/\n*.pyc\n*.pyo\n*.pyd\n.env\n.venv/\ndist/\nbuild/\n*.egg-info/",
-                    "node": "node_modules/\nnpm-debug.log*\n.env\ndist/\nbuild/",
-                    "java": "target/\n*.class\n*.jar\n*.war\n*.ear",
-                    "golang": "bin/\n*.exe\ngo.sum",
-                    "rust": "target/\nCargo.lock",
-                }.get(language, "")
-
-                with open(project_path / ".gitignore", "w") as f:
-                    f.write(gitignore_content)
+                )
 
                 return f"Project template created for {project_name} ({language}) with features: {', '.join(features) if features else 'basic'}"
 
@@ -351,11 +419,12 @@ public class Main {{
                     return f"Container {container_id} not found"
 
                 # Read file content
-                result = container.exec_run(f"cat {file_path}")
-                if result.exit_code != 0:
-                    return f"Error reading file {file_path}: {result.output.decode('utf-8')}"
-
-                file_content = result.output.decode("utf-8")
+                try:
+                    file_content = await asyncio.to_thread(
+                        self._read_container_file, container, file_path
+                    )
+                except (docker.errors.NotFound, ValueError) as e:
+                    return f"Error reading file {file_path}: {str(e)}"
 
                 # Basic code analysis
                 analysis = {
@@ -370,13 +439,17 @@ public class Main {{
 
                 if file_ext == ".py":
                     analysis["language"] = "Python"
-                    # Check for common Python issues
-                    lines = file_content.splitlines()
-                    for i, line in enumerate(lines, 1):
-                        if line.strip().startswith("print(") and '"' in line:
+                    # Check for common Python issues. The regex finds the
+                    # candidate lines in one pass, so only those reach Python
+                    line_no, line_start = 1, 0
+                    for match in _PY_RULE_LINES.finditer(file_content):
+                        line_no += file_content.count("\n", line_start, match.start())
+                        line_start = match.start()
+                        line = match.group()
+                        if _PY_PRINT.match(line):
                             analysis["suggestions"].append(
                                 {
-                                    "line": i,
+                                    "line": line_no,
                                     "type": "style",
                                     "message": "Consider using logging instead of print for production code",
                                 }
@@ -384,7 +457,7 @@ public class Main {{
                         if "import *" in line:
                             analysis["suggestions"].append(
                                 {
-                                    "line": i,
+                                    "line": line_no,
                                     "type": "best_practice",
                                     "message": "Avoid wildcard imports, import specific modules",
                                 }
@@ -416,6 +489,150 @@ public class Main {{
             except Exception as e:
                 return f"Error analyzing code: {str(e)}"
 
+    @staticmethod
+    def _install_command(config: Dict[str, Any]) -> str:
+        """Package manager command installing a language config's packages"""
+        packages = " ".join(config["packages"])
+        if "alpine" in config["image"]:
+            return f"apk add --no-cache {packages}"
+        return f"apt-get update && DEBIAN_FRONTEND=noninteractive apt-get install -y {packages}"
+
+    def _start_dev_container(
+        self,
+        config: Dict[str, Any],
+        pool_key: str,
+        container_name: str,
+        run_kwargs: Dict[str, Any],
+    ):
+        """Borrow or start a dev container, preferring the baked image"""
+        # Start from an image with the toolchain already installed, falling
+        # back to installing it in the container
+        image = self._get_dev_image(config) or config["image"]
+
+        # Released dev containers keep their installed toolchain, so they are
+        # pooled per language rather than per base image
+        if self.container_pool is not None:
+            container = self.container_pool.borrow(
+                image, pool_key=pool_key, name=container_name, **run_kwargs
+            )
+            # Only a reused container still has its old name
+            if container.name != container_name:
+                container.rename(container_name)
+        else:
+            container = self.docker_client.containers.run(
+                image=image, name=container_name, **run_kwargs
+            )
+        if image != config["image"]:
+            self._provisioned.add(container.id)
+        return container
+
+    def _get_dev_image(self, config: Dict[str, Any]) -> Optional[str]:
+        """Tag of an image with the config's packages baked in, building it once
+
+        Returns None if the image couldn't be built, e.g. without network access.
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                [config["image"], config["packages"], config["setup_commands"]]
+            ).encode()
+        ).hexdigest()[:12]
+        if key in self._image_cache:
+            return self._image_cache[key]
+
+        # Concurrent requests for the same language wait for one build
+        with self._image_lock:
+            if key not in self._image_cache:
+                self._image_cache[key] = self._build_dev_image(config, key)
+            return self._image_cache[key]
+
+    def _build_dev_image(self, config: Dict[str, Any], key: str) -> Optional[str]:
+        """Reuse or build the mcp-dev-<key> image, returning None on failure"""
+        tag = f"mcp-dev-{key}:latest"
+        try:
+            # Images built by an earlier server run are still in the local store
+            self.docker_client.images.get(tag)
+        except Exception:
+            steps = [f"FROM {config['image']}"]
+            if config["packages"]:
+                steps.append(f"RUN {self._install_command(config)}")
+            steps.extend(f"RUN {cmd}" for cmd in config["setup_commands"])
+            dockerfile = "\n".join(steps) + "\n"
+            try:
+                self.docker_client.images.build(
+                    fileobj=io.BytesIO(dockerfile.encode()), tag=tag, rm=True
+                )
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Could not build dev image {tag}: {e}")
+                # Cached as None, so a slow failing build isn't retried
+                return None
+
+        return tag
+
+    @staticmethod
+    def _read_container_file(container, file_path: str) -> str:
+        """Read a text file out of a container through the archive API
+
+        Unlike exec'ing cat, this doesn't start a process in the container.
+        Symlinks are followed, since the archive only holds the link itself.
+        """
+        path = file_path
+        if not posixpath.isabs(path):
+            # cat resolved relative paths from the working directory, while
+            # the archive API resolves them from the container root
+            working_dir = container.attrs["Config"]["WorkingDir"] or "/"
+            path = posixpath.join(working_dir, path)
+        for _ in range(_MAX_SYMLINK_HOPS):
+            bits, _ = container.get_archive(path)
+            with tarfile.open(fileobj=io.BytesIO(b"".join(bits))) as tar:
+                member = tar.next()
+                if member is not None and member.issym():
+                    path = posixpath.normpath(
+                        posixpath.join(posixpath.dirname(path), member.linkname)
+                    )
+                    continue
+                if member is None or not member.isfile():
+                    raise ValueError(f"{file_path} is not a regular file")
+                return tar.extractfile(member).read().decode("utf-8")
+        raise ValueError(f"Too many levels of symbolic links in {file_path}")
+
+    def _index_container(self, container_id: str, name: str):
+        """Record a container created here for name and ID prefix lookups"""
+        i = bisect.bisect_left(self._sorted_ids, container_id)
+        if i < len(self._sorted_ids) and self._sorted_ids[i] == container_id:
+            # A reused pooled container; its previous name no longer exists
+            self._name_index = {
+                indexed_name: indexed_id
+                for indexed_name, indexed_id in self._name_index.items()
+                if indexed_id != container_id
+            }
+        else:
+            self._sorted_ids.insert(i, container_id)
+        self._name_index[name] = container_id
+
+    def _prune_index(self):
+        """Drop index entries for containers deleted through other tools"""
+        self._name_index = {
+            name: container_id
+            for name, container_id in self._name_index.items()
+            if container_id in self.active_containers
+        }
+        self._sorted_ids = [
+            container_id
+            for container_id in self._sorted_ids
+            if container_id in self.active_containers
+        ]
+
+    def _prefix_matches(self, prefix: str) -> List[str]:
+        """Indexed container IDs starting with prefix"""
+        ids = self._sorted_ids
+        matches = []
+        i = bisect.bisect_left(ids, prefix)
+        while i < len(ids) and ids[i].startswith(prefix):
+            matches.append(ids[i])
+            i += 1
+        return matches
+
     def _find_container(self, container_id: str):
         """Find a container by ID or name"""
         try:
@@ -423,6 +640,26 @@ public class Main {{
             if container_id in self.active_containers:
                 return self.active_containers[container_id]["container"]
 
+            # Then names and ID prefixes of the containers created here
+            indexed_id = self._name_index.get(container_id)
+            if indexed_id is None:
+                matches = self._prefix_matches(container_id)
+                if any(cid not in self.active_containers for cid in matches):
+                    # Stale entries must not make a unique prefix look ambiguous
+                    self._prune_index()
+                    matches = self._prefix_matches(container_id)
+                if len(matches) == 1:
+                    indexed_id = matches[0]
+                elif matches and self.logger:
+                    # Leave ambiguous prefixes for Docker to resolve below
+                    self.logger.warning(
+                        f"Container ID prefix {container_id} matches several dev containers"
+                    )
+            if indexed_id is not None:
+                if indexed_id in self.active_containers:
+                    return self.active_containers[indexed_id]["container"]
+                self._prune_index()
+
             # Try to get from Docker directly
             try:
                 return self.docker_client.containers.get(container_id)
@@ -2,29 +2,50 @@
 Docker management tools for container operations
 """
 
+import asyncio
 import docker
 import tempfile
 import os
 import tarfile
 import io
-import subprocess
 import json
 import time
 import psutil
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from subtools.fastcache import FastTTLCache
+from subtools.gpu_monitor import GPUMonitor
+from subtools.serialization import dumps
+
+STATUS_CACHE_TTL = 2.0  # seconds; collapses bursts of status polls
+
 
 class DockerTools:
     """Core Docker management functionality"""
 
-    def __init__(self, docker_client, allowed_images: set, temp_dir: str, logger=None):
+    def __init__(
+        self,
+        docker_client,
+        allowed_images: frozenset,
+        temp_dir: str,
+        logger=None,
+        container_pool=None,
+        active_containers: dict = None,
+    ):
         self.docker_client = docker_client
         self.allowed_images = allowed_images
         self.temp_dir = temp_dir
         self.logger = logger
-        self.active_containers = {}
+        self.container_pool = container_pool
+        # Shared with the other tool modules so containers created there can
+        # be found, released to the pool and cleaned up from here
+        self.active_containers = (
+            active_containers if active_containers is not None else {}
+        )
         self.active_streams = {}
+        self.gpu_monitor = GPUMonitor(logger=logger)
+        self.status_cache = FastTTLCache(maxsize=8, ttl=STATUS_CACHE_TTL)
 
     def register_tools(self, mcp_server):
         """Register Docker management tools with the MCP server"""
@@ -36,114 +57,33 @@ class DockerTools:
 
         @mcp_server.tool()
         async def inspect_container(container: str):
-            """Inspects the container, and runs the command docker command"""
-            inspected = subprocess.run(
-                ["docker", "container", "inspect", container],
-                capture_output=True,
-                timeout=20,
-            )
-            if inspected.returncode == 0:
-                data = inspected.stdout
-                return json.dumps(data)
-            else:
-                return f"Error: {inspected.stderr}"
+            """Inspects the container and returns its low-level Docker details"""
+            try:
+                # Same payload as `docker container inspect`, over the existing
+                # API connection instead of spawning the CLI
+                inspected = self.docker_client.api.inspect_container(container)
+                return json.dumps([inspected], indent=4)
+            except docker.errors.DockerException as e:
+                return f"Error: {str(e)}"
 
         @mcp_server.tool()
         async def get_gpu_status() -> str:
             """Get GPU status and availability (NVIDIA and AMD)"""
-            status_info = []
-
-            # Check NVIDIA GPU status
-            try:
-                result = subprocess.run(
-                    [
-                        "nvidia-smi",
-                        "--query-gpu=name,memory.total,memory.used,utilization.gpu",
-                        "--format=csv,noheader,nounits",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    nvidia_info = []
-                    for line in result.stdout.strip().split("\n"):
-                        if line.strip():
-                            name, mem_total, mem_used, utilization = [
-                                x.strip() for x in line.split(",")
-                            ]
-                            nvidia_info.append(
-                                {
-                                    "name": name,
-                                    "memory_total_mb": int(mem_total),
-                                    "memory_used_mb": int(mem_used),
-                                    "utilization_percent": int(utilization),
-                                }
-                            )
-                    status_info.append(
-                        {"type": "NVIDIA", "gpus": nvidia_info, "available": True}
-                    )
-                else:
-                    status_info.append(
-                        {
-                            "type": "NVIDIA",
-                            "available": False,
-                            "error": "nvidia-smi failed",
-                        }
-                    )
-            except (
-                subprocess.TimeoutExpired,
-                FileNotFoundError,
-                subprocess.SubprocessError,
-            ):
-                status_info.append(
-                    {
-                        "type": "NVIDIA",
-                        "available": False,
-                        "error": "nvidia-smi not found or failed",
-                    }
-                )
-
-            # Check AMD ROCm status
-            try:
-                result = subprocess.run(
-                    [
-                        "rocm-smi",
-                        "--showproductname",
-                        "--showmeminfo",
-                        "vram",
-                        "--showuse",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    status_info.append(
-                        {"type": "AMD_ROCm", "available": True, "info": "ROCm detected"}
-                    )
-                else:
-                    status_info.append(
-                        {
-                            "type": "AMD_ROCm",
-                            "available": False,
-                            "error": "rocm-smi failed",
-                        }
-                    )
-            except (
-                subprocess.TimeoutExpired,
-                FileNotFoundError,
-                subprocess.SubprocessError,
-            ):
-                status_info.append(
-                    {
-                        "type": "AMD_ROCm",
-                        "available": False,
-                        "error": "rocm-smi not found",
-                    }
+            cached = self.status_cache.get("gpu_status")
+            if cached is not None:
+                return cached
+
+            # Check NVIDIA and AMD ROCm status concurrently
+            status_info = list(
+                await asyncio.gather(
+                    asyncio.to_thread(self.gpu_monitor.nvidia_status),
+                    self._get_rocm_status(),
                 )
+            )
 
-            return json.dumps(status_info, indent=2)
+            result = dumps(status_info)
+            self.status_cache["gpu_status"] = result
+            return result
 
         @mcp_server.tool()
         async def create_container(
@@ -153,8 +93,9 @@ class DockerTools:
             environment: Dict[str, str] = None,
             ports: Dict[str, int] = None,
             use_gpu: bool = False,
+            reuse: bool = False,
         ) -> str:
-            """Create and start a new Docker container that runs indefinitely"""
+            """Create and start a new Docker container that runs indefinitely. With reuse=True and otherwise default settings, an idle container from the pool may be handed out as-is, with files, packages and processes left by a previous user, and delete_container returns it to the pool instead of removing it"""
             if image not in self.allowed_images:
                 return f"Error: Image '{image}' is not in the allowed list. Use list_allowed_images() to see available images."
 
@@ -211,13 +152,28 @@ class DockerTools:
                 }
                 os.makedirs("/tmp/workspace", exist_ok=True)
 
-                container = self.docker_client.containers.run(**container_config)
+                # Containers with default settings are interchangeable, so
+                # callers that accept leftover state can borrow them from and
+                # return them to the pool
+                pooled = (
+                    reuse
+                    and self.container_pool is not None
+                    and not (name or command or environment or ports or use_gpu)
+                )
+                if pooled:
+                    container = self.container_pool.borrow(**container_config)
+                else:
+                    container = self.docker_client.containers.run(**container_config)
 
                 self.active_containers[container.id] = {
                     "container": container,
                     "name": name or container.name,
                     "created_at": time.time(),
                     "image": image,
+                    "pooled": pooled,
+                    # Only pooled containers are the server's to tear down at
+                    # shutdown; the rest belong to the client
+                    "owned_by_server": pooled,
                 }
 
                 return f"Container created successfully: {container.name} ({container.id[:12]})"
@@ -372,12 +328,25 @@ class DockerTools:
 
         @mcp_server.tool()
         async def delete_container(container_id: str) -> str:
-            """Delete a container (stops and removes it)"""
+            """Delete a container (stops and removes it). Running containers created with reuse=True, and dev environments, are instead returned to the container pool without being reset"""
             container = self._find_container(container_id)
             if not container:
                 return f"Container {container_id} not found"
 
             try:
+                # Keep pooled containers running so they can be reused
+                container_info = self.active_containers.get(container.id)
+                if (
+                    container_info
+                    and container_info.get("pooled")
+                    and self.container_pool.release(
+                        container,
+                        container_info.get("pool_key", container_info["image"]),
+                    )
+                ):
+                    del self.active_containers[container.id]
+                    return f"Container {container_id} returned to the container pool"
+
                 container.stop()
                 container.remove()
 
@@ -402,6 +371,33 @@ class DockerTools:
             except Exception as e:
                 return f"Error getting container logs: {str(e)}"
 
+    async def _get_rocm_status(self) -> Dict[str, Any]:
+        """Check for AMD ROCm without blocking the event loop"""
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "rocm-smi",
+                "--showproductname",
+                "--showmeminfo",
+                "vram",
+                "--showuse",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            returncode = await asyncio.wait_for(process.wait(), timeout=10)
+        except (asyncio.TimeoutError, OSError):
+            if process is not None and process.returncode is None:
+                process.kill()
+            return {
+                "type": "AMD_ROCm",
+                "available": False,
+                "error": "rocm-smi not found",
+            }
+
+        if returncode == 0:
+            return {"type": "AMD_ROCm", "available": True, "info": "ROCm detected"}
+        return {"type": "AMD_ROCm", "available": False, "error": "rocm-smi failed"}
+
     def _find_container(self, container_id: str):
         """Find a container by ID or name"""
         try:
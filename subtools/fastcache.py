@@ -0,0 +1,80 @@
+"""
+Lightweight fixed-TTL cache for hot server lookups
+"""
+
+import itertools
+import time
+
+
+class FastTTLCache:
+    """TTL cache backed by a single dict of key -> (value, expiry)
+
+    Every entry shares the same TTL and is re-inserted on write, so the
+    dict's insertion order is also its expiry order. Expired entries are
+    dropped lazily on read and swept from the front when the cache is full.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_store", "_get", "_pop")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._store = {}
+        self._get = self._store.get
+        self._pop = self._store.pop
+
+    def get(self, key, default=None):
+        entry = self._get(key)
+        if entry is None:
+            return default
+        if entry[1] > time.monotonic():
+            return entry[0]
+        self._pop(key, None)
+        return default
+
+    def __getitem__(self, key):
+        entry = self._get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        self._pop(key, None)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        store = self._store
+        self._pop(key, None)
+        if len(store) >= self.maxsize:
+            self.expire()
+            while len(store) >= self.maxsize:
+                self._pop(next(iter(store)))
+        store[key] = (value, time.monotonic() + self.ttl)
+
+    def __delitem__(self, key):
+        del self._store[key]
+
+    def __contains__(self, key):
+        entry = self._get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self):
+        return len(self._store)
+
+    def pop(self, key, default=None):
+        entry = self._pop(key, None)
+        return default if entry is None else entry[0]
+
+    def expire(self) -> int:
+        """Drop every expired entry and return how many were removed"""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, _ in itertools.takewhile(
+                lambda item: item[1][1] <= now, self._store.items()
+            )
+        ]
+        pop = self._pop
+        for key in expired:
+            pop(key, None)
+        return len(expired)
+
+    def clear(self):
+        self._store.clear()
@@ -0,0 +1,263 @@
+"""
+NVIDIA GPU status collection via NVML, with an nvidia-smi fallback
+"""
+
+import atexit
+import csv
+import io
+import subprocess
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+# Optional imports
+try:
+    import pynvml
+
+    HAS_PYNVML = True
+except ImportError:
+    HAS_PYNVML = False
+
+_DYNAMIC_FIELDS = "memory.total,memory.used,utilization.gpu"
+_STREAM_INTERVAL_MS = 1000
+_STREAM_MAX_AGE = 5.0  # seconds before streamed readings are considered stale
+_MISSING_RETRY = 3600.0  # seconds before looking for nvidia-smi again
+_FAILURE_BACKOFF_MAX = 300.0
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """Parse an nvidia-smi field, mapping placeholders like [N/A] to None"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _gpu_reading(
+    memory_total_mb: Optional[int],
+    memory_used_mb: Optional[int],
+    utilization_percent: Optional[int],
+) -> Dict[str, Any]:
+    """Per-device dynamic fields, including the derived memory percentage"""
+    memory_percent = None
+    if memory_total_mb and memory_used_mb is not None:
+        memory_percent = round(memory_used_mb / memory_total_mb * 100, 1)
+    return {
+        "memory_total_mb": memory_total_mb,
+        "memory_used_mb": memory_used_mb,
+        "memory_percent": memory_percent,
+        "utilization_percent": utilization_percent,
+    }
+
+
+class GPUMonitor:
+    """Reads NVIDIA GPU status through NVML bindings when available"""
+
+    def __init__(self, logger=None):
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._nvml_handles = None  # None until NVML initialisation is attempted
+        self._static_info = None  # per-device name/driver, fixed at runtime
+
+        # Long-running nvidia-smi used when NVML is unavailable
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._streamed = (0.0, {})  # (updated_at, index -> readings)
+        self._close_registered = False
+
+        # Backoff state so a missing or failing nvidia-smi isn't re-forked
+        self._smi_failures = 0
+        self._smi_retry_at = 0.0
+        self._smi_error = None
+
+    def _get_nvml_handles(self) -> List:
+        """Initialise NVML once and cache a handle per device"""
+        with self._lock:
+            if self._nvml_handles is None:
+                self._nvml_handles = []
+                if HAS_PYNVML:
+                    try:
+                        pynvml.nvmlInit()
+                        self._nvml_handles = [
+                            pynvml.nvmlDeviceGetHandleByIndex(i)
+                            for i in range(pynvml.nvmlDeviceGetCount())
+                        ]
+                    except pynvml.NVMLError as e:
+                        if self.logger:
+                            self.logger.info(f"NVML unavailable, using nvidia-smi: {e}")
+            return self._nvml_handles
+
+    def nvidia_status(self) -> Dict[str, Any]:
+        """NVIDIA status entry in the format returned by get_gpu_status"""
+        handles = self._get_nvml_handles()
+        if handles:
+            try:
+                if self._static_info is None:
+                    self._static_info = self._read_nvml_static(handles)
+                gpus = [
+                    {**static, **self._read_nvml_device(handle)}
+                    for static, handle in zip(self._static_info, handles)
+                ]
+                return {"type": "NVIDIA", "gpus": gpus, "available": True}
+            except pynvml.NVMLError as e:
+                if self.logger:
+                    self.logger.warning(f"NVML query failed, using nvidia-smi: {e}")
+
+        return self._query_nvidia_smi()
+
+    @staticmethod
+    def _read_nvml_static(handles) -> List[Dict[str, Any]]:
+        driver_version = pynvml.nvmlSystemGetDriverVersion()
+        if isinstance(driver_version, bytes):  # older bindings return bytes
+            driver_version = driver_version.decode()
+
+        static_info = []
+        for handle in handles:
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode()
+            static_info.append({"name": name, "driver_version": driver_version})
+        return static_info
+
+    @staticmethod
+    def _read_nvml_device(handle) -> Dict[str, Any]:
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        return _gpu_reading(
+            memory.total // (1024**2), memory.used // (1024**2), utilization.gpu
+        )
+
+    def _query_nvidia_smi(self) -> Dict[str, Any]:
+        """nvidia-smi fallback, backing off after failures instead of re-forking"""
+        now = time.monotonic()
+        if now < self._smi_retry_at:
+            return self._smi_error
+
+        try:
+            status = self._query_nvidia_smi_once()
+        except FileNotFoundError:
+            # No NVIDIA tooling installed; this won't change any time soon
+            status = {
+                "type": "NVIDIA",
+                "available": False,
+                "error": "nvidia-smi not found or failed",
+            }
+            delay = _MISSING_RETRY
+        else:
+            if status["available"]:
+                self._smi_failures = 0
+                return status
+            delay = min(5.0 * 2**self._smi_failures, _FAILURE_BACKOFF_MAX)
+
+        self._smi_failures += 1
+        self._smi_retry_at = now + delay
+        self._smi_error = status
+        return status
+
+    def _query_nvidia_smi_once(self) -> Dict[str, Any]:
+        try:
+            # Names and driver version never change, so only ask for them once
+            if self._static_info is None:
+                rows = self._run_nvidia_smi("name,driver_version")
+                if rows is None:
+                    return {
+                        "type": "NVIDIA",
+                        "available": False,
+                        "error": "nvidia-smi failed",
+                    }
+                self._static_info = [
+                    {"name": name, "driver_version": driver_version}
+                    for name, driver_version in rows
+                ]
+
+            rows = self._streamed_rows()
+            if rows is None:
+                rows = self._run_nvidia_smi(_DYNAMIC_FIELDS)
+        except subprocess.SubprocessError:
+            return {
+                "type": "NVIDIA",
+                "available": False,
+                "error": "nvidia-smi not found or failed",
+            }
+
+        if rows is None:
+            return {"type": "NVIDIA", "available": False, "error": "nvidia-smi failed"}
+
+        nvidia_info = []
+        for static, (mem_total, mem_used, utilization) in zip(self._static_info, rows):
+            nvidia_info.append(
+                {
+                    **static,
+                    **_gpu_reading(
+                        _parse_int(mem_total),
+                        _parse_int(mem_used),
+                        _parse_int(utilization),
+                    ),
+                }
+            )
+        return {"type": "NVIDIA", "gpus": nvidia_info, "available": True}
+
+    @staticmethod
+    def _run_nvidia_smi(fields: str):
+        """Run an nvidia-smi --query-gpu and return its rows, or None on failure"""
+        result = subprocess.run(
+            ["nvidia-smi", f"--query-gpu={fields}", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return None
+        reader = csv.reader(io.StringIO(result.stdout), skipinitialspace=True)
+        return [row for row in reader if row]
+
+    def _streamed_rows(self):
+        """Latest readings from the background nvidia-smi, or None if not ready"""
+        with self._stream_lock:
+            if self._stream is None or self._stream.poll() is not None:
+                self._start_stream()
+                return None
+            updated_at, readings = self._streamed
+
+        if time.monotonic() - updated_at > _STREAM_MAX_AGE:
+            return None
+        try:
+            return [readings[str(index)] for index in range(len(self._static_info))]
+        except KeyError:
+            return None
+
+    def _start_stream(self):
+        """Spawn nvidia-smi in loop mode so polls don't fork a process each time"""
+        self._stream = subprocess.Popen(
+            [
+                "nvidia-smi",
+                f"--query-gpu=index,{_DYNAMIC_FIELDS}",
+                "--format=csv,noheader,nounits",
+                f"--loop-ms={_STREAM_INTERVAL_MS}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        threading.Thread(
+            target=self._read_stream, args=(self._stream,), daemon=True
+        ).start()
+        if not self._close_registered:
+            atexit.register(self.close)
+            self._close_registered = True
+
+    def _read_stream(self, process):
+        readings = {}
+        for fields in csv.reader(process.stdout, skipinitialspace=True):
+            if len(fields) != 4:
+                continue
+            readings[fields[0]] = fields[1:]
+            with self._stream_lock:
+                self._streamed = (time.monotonic(), dict(readings))
+
+    def close(self):
+        """Stop the background nvidia-smi process, if one is running"""
+        with self._stream_lock:
+            if self._stream is not None and self._stream.poll() is None:
+                self._stream.terminate()
+            self._stream = None
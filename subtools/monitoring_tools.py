@@ -2,7 +2,10 @@
 Monitoring and metrics tools for system and container performance
 """
 
+import asyncio
 import json
+import shutil
+import threading
 import time
 import psutil
 import docker
@@ -10,6 +13,14 @@ from typing import Dict, Any, List
 from collections import defaultdict
 from datetime import datetime
 
+from subtools.fastcache import FastTTLCache
+from subtools.serialization import dumps
+
+STATUS_CACHE_TTL = 2.0  # seconds; collapses bursts of status polls
+
+# The logical CPU count can't change while the server runs
+_CPU_COUNT = psutil.cpu_count()
+
 
 class MonitoringTools:
     """System and container monitoring functionality"""
@@ -27,6 +38,9 @@ class MonitoringTools:
             "error_rates": defaultdict(int),
             "resource_usage": defaultdict(list),
         }
+        self.status_cache = FastTTLCache(maxsize=8, ttl=STATUS_CACHE_TTL)
+        self._last_cpu_percent = None
+        self._cpu_sampler_thread = None
 
     def register_tools(self, mcp_server):
         """Register monitoring tools with the MCP server"""
@@ -34,10 +48,13 @@ class MonitoringTools:
         @mcp_server.tool()
         async def monitor_system_resources() -> str:
             """Monitor system CPU, memory, disk, and network usage"""
+            cached = self.status_cache.get("system_resources")
+            if cached is not None:
+                return cached
+
             try:
                 # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
-                cpu_count = psutil.cpu_count()
+                cpu_percent = await self._get_cpu_percent()
                 cpu_freq = psutil.cpu_freq()
 
                 # Memory usage
@@ -48,7 +65,7 @@ class MonitoringTools:
                 disk_usage = []
                 for partition in psutil.disk_partitions():
                     try:
-                        partition_usage = psutil.disk_usage(partition.mountpoint)
+                        partition_usage = shutil.disk_usage(partition.mountpoint)
                         disk_usage.append(
                             {
                                 "device": partition.device,
@@ -70,11 +87,12 @@ class MonitoringTools:
                 # Network usage
                 network = psutil.net_io_counters()
 
+                timestamp = datetime.now().isoformat()
                 system_info = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "cpu": {
                         "percent": cpu_percent,
-                        "count": cpu_count,
+                        "count": _CPU_COUNT,
                         "frequency_mhz": cpu_freq.current if cpu_freq else None,
                     },
                     "memory": {
@@ -98,11 +116,11 @@ class MonitoringTools:
                 }
 
                 # Store for historical tracking
-                self.performance_metrics["system_stats"][
-                    datetime.now().isoformat()
-                ] = system_info
+                self.performance_metrics["system_stats"][timestamp] = system_info
 
-                return json.dumps(system_info, indent=2)
+                result = dumps(system_info)
+                self.status_cache["system_resources"] = result
+                return result
 
             except Exception as e:
                 return f"Error monitoring system resources: {str(e)}"
@@ -111,12 +129,12 @@ class MonitoringTools:
         async def monitor_container_performance(container_id: str) -> str:
             """Monitor performance metrics for a specific container"""
             try:
-                container = self._find_container(container_id)
+                container = await asyncio.to_thread(self._find_container, container_id)
                 if not container:
                     return f"Container {container_id} not found"
 
                 # Get container stats
-                stats = container.stats(stream=False)
+                stats = await asyncio.to_thread(container.stats, stream=False)
 
                 # Calculate CPU usage
                 cpu_stats = stats.get("cpu_stats", {})
@@ -194,7 +212,7 @@ class MonitoringTools:
                     container_id
                 ] = container_performance
 
-                return json.dumps(container_performance, indent=2)
+                return dumps(container_performance)
 
             except Exception as e:
                 return f"Error monitoring container performance: {str(e)}"
@@ -202,16 +220,16 @@ class MonitoringTools:
         @mcp_server.tool()
         async def get_server_status() -> str:
             """Get comprehensive server status and health information"""
-            try:
-                # Docker status
-                docker_info = self.docker_client.info()
+            cached = self.status_cache.get("server_status")
+            if cached is not None:
+                return cached
 
-                # Active containers count
-                containers = self.docker_client.containers.list(all=True)
-                running_containers = len(
-                    [c for c in containers if c.status == "running"]
-                )
-                total_containers = len(containers)
+            try:
+                # Docker status; /info already carries the container and image
+                # counts, so there is no need to list and count them here
+                docker_info = await asyncio.to_thread(self.docker_client.info)
+                running_containers = docker_info.get("ContainersRunning", 0)
+                total_containers = docker_info.get("Containers", 0)
 
                 # System uptime
                 boot_time = psutil.boot_time()
@@ -237,19 +255,17 @@ class MonitoringTools:
                         "version": docker_info.get("ServerVersion", "Unknown"),
                         "containers_running": running_containers,
                         "containers_total": total_containers,
-                        "images_count": len(self.docker_client.images.list()),
+                        "images_count": docker_info.get("Images", 0),
                         "storage_driver": docker_info.get("Driver", "Unknown"),
                         "kernel_version": docker_info.get("KernelVersion", "Unknown"),
                     },
                     "resources": {
-                        "cpu_count": psutil.cpu_count(),
+                        "cpu_count": _CPU_COUNT,
                         "memory_total_gb": round(
                             psutil.virtual_memory().total / (1024**3), 2
                         ),
-                        "disk_total_gb": (
-                            round(psutil.disk_usage("/").total / (1024**3), 2)
-                            if psutil.disk_usage("/")
-                            else 0
+                        "disk_total_gb": round(
+                            shutil.disk_usage("/").total / (1024**3), 2
                         ),
                     },
                     "active_services": {
@@ -259,7 +275,9 @@ class MonitoringTools:
                     },
                 }
 
-                return json.dumps(status_info, indent=2)
+                result = dumps(status_info)
+                self.status_cache["server_status"] = result
+                return result
 
             except Exception as e:
                 return f"Error getting server status: {str(e)}"
@@ -270,22 +288,25 @@ class MonitoringTools:
         ) -> str:
             """Create a backup of a container and its data"""
             try:
-                container = self._find_container(container_id)
+                container = await asyncio.to_thread(self._find_container, container_id)
                 if not container:
                     return f"Container {container_id} not found"
 
+                now = datetime.now()
                 if not backup_name:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = now.strftime("%Y%m%d_%H%M%S")
                     backup_name = f"{container.name}_backup_{timestamp}"
 
                 # Commit the container to create an image
-                image = container.commit(repository=backup_name, tag="latest")
+                image = await asyncio.to_thread(
+                    container.commit, repository=backup_name, tag="latest"
+                )
 
                 backup_info = {
                     "backup_name": backup_name,
                     "original_container": container_id,
                     "image_id": image.id,
-                    "created": datetime.now().isoformat(),
+                    "created": now.isoformat(),
                     "size_mb": round(image.attrs.get("Size", 0) / (1024**2), 2),
                 }
 
@@ -305,21 +326,25 @@ class MonitoringTools:
                 if not workspace_path.exists():
                     return "Workspace directory does not exist"
 
+                now = datetime.now()
                 if not backup_name:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = now.strftime("%Y%m%d_%H%M%S")
                     backup_name = f"workspace_backup_{timestamp}.tar.gz"
 
                 backup_path = Path("/tmp") / backup_name
 
-                with tarfile.open(backup_path, "w:gz") as tar:
-                    tar.add(workspace_path, arcname="workspace")
+                def _archive():
+                    with tarfile.open(backup_path, "w:gz") as tar:
+                        tar.add(workspace_path, arcname="workspace")
+
+                await asyncio.to_thread(_archive)
 
                 backup_size = backup_path.stat().st_size
 
                 backup_info = {
                     "backup_name": backup_name,
                     "backup_path": str(backup_path),
-                    "created": datetime.now().isoformat(),
+                    "created": now.isoformat(),
                     "size_bytes": backup_size,
                     "size_mb": round(backup_size / (1024**2), 2),
                 }
@@ -329,6 +354,24 @@ class MonitoringTools:
             except Exception as e:
                 return f"Error creating workspace backup: {str(e)}"
 
+    def _sample_cpu_forever(self):
+        """Refresh the system CPU percentage once a second in the background"""
+        while True:
+            self._last_cpu_percent = psutil.cpu_percent(interval=1)
+
+    async def _get_cpu_percent(self) -> float:
+        """Latest background CPU sample, starting the sampler on first use"""
+        if self._cpu_sampler_thread is None:
+            self._cpu_sampler_thread = threading.Thread(
+                target=self._sample_cpu_forever, daemon=True
+            )
+            self._cpu_sampler_thread.start()
+
+        if self._last_cpu_percent is None:
+            # No sample yet; measure one second directly rather than report 0.0
+            return await asyncio.to_thread(psutil.cpu_percent, 1)
+        return self._last_cpu_percent
+
     def _find_container(self, container_id: str):
         """Find a container by ID or name"""
         try:
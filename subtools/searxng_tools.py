@@ -253,6 +253,10 @@ class SearXNGTools:
     async def _get_status(self) -> Dict[str, Any]:
         """Check SearXNG instance status"""
         try:
+            import time
+
+            start_time = time.monotonic()
+
             # Test SearXNG by doing a simple search (more reliable than /stats)
             response = requests.get(
                 f"{self.searxng_url}/search",
@@ -267,12 +271,8 @@ class SearXNGTools:
                 "response_time_ms": None,
             }
 
-            import time
-
-            start_time = time.time()
-
             if response.status_code == 200:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.monotonic() - start_time) * 1000
                 try:
                     search_result = response.json()
                     status_info.update(
@@ -296,7 +296,7 @@ class SearXNGTools:
                 # Try basic health check
                 health_response = requests.get(f"{self.searxng_url}/", timeout=5)
                 if health_response.status_code == 200:
-                    response_time = (time.time() - start_time) * 1000
+                    response_time = (time.monotonic() - start_time) * 1000
                     status_info.update(
                         {
                             "available": True,
@@ -0,0 +1,23 @@
+"""
+JSON serialization for tool responses, using orjson when it is installed
+"""
+
+import json
+
+# Optional imports
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj) -> str:
+    """Serialize to a 2-space indented JSON string"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # types orjson rejects (e.g. non-str keys) take the slow path
+    return json.dumps(obj, indent=2, default=str)